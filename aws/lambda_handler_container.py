@@ -9,6 +9,7 @@ Key Features:
 - Credential fetching: Optimized boto3 credential handling for GDAL
 - GDAL configuration: Optimized for AWS S3 and requester-pays buckets
 - Single-region processing per Lambda invocation
+- Optional dispatcher mode: {"batch": [...]} re-invokes this function per region
 - Results uploaded to S3 with consistent directory structure
 
 Processing Strategy:
@@ -34,6 +35,7 @@ import boto3
 import subprocess
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Set up logging
@@ -346,6 +348,43 @@ def upload_results_to_s3(s3_bucket, base_dir, satellite, s3_base_path='1_downloa
         logger.error(f"Upload failed: {e}", exc_info=True)
         return []
 
+def dispatch_batch(events, function_name):
+    """Re-invoke this function asynchronously once per region event (tree fan-out).
+
+    The submitter sends {"batch": [event1, event2, ...]} to a handful of dispatcher
+    invocations instead of invoking every region itself (submit_aws_job.py --fanout tree).
+
+    Args:
+        events (list): Single-region event payloads
+        function_name (str): Name of the Lambda function to invoke (this function)
+
+    Returns:
+        dict: Dispatch results with statusCode and body
+    """
+    lambda_client = boto3.client('lambda')
+
+    def invoke(sub_event):
+        lambda_client.invoke(FunctionName=function_name, InvocationType='Event', Payload=json.dumps(sub_event))
+        return sub_event.get('region')
+
+    dispatched, failed = [], []
+    with ThreadPoolExecutor(max_workers=max(1, min(len(events), 32))) as executor:
+        futures = {executor.submit(invoke, sub_event): sub_event for sub_event in events}
+        for future in as_completed(futures):
+            region = futures[future].get('region')
+            try:
+                future.result()
+                dispatched.append(region)
+                logger.info(f"Dispatched: {region}")
+            except Exception as e:
+                failed.append(region)
+                logger.error(f"Dispatch failed for {region}: {e}")
+
+    return {
+        'statusCode': 200 if not failed else 500,
+        'body': json.dumps({'dispatched': dispatched, 'failed': failed})
+    }
+
 def handler(event, context):
     """Lambda handler for satellite processing - container version.
     
@@ -359,6 +398,15 @@ def handler(event, context):
     Returns:
         dict: Processing results with statusCode and body
     """
+    # EventBridge delivery (--fanout eventbridge): the region event is the envelope's detail
+    if event.get('source') == 'glacier.orchestrator' and 'detail' in event:
+        event = event['detail']
+
+    # Dispatcher invocation (tree fan-out): forward each region event and return
+    if 'batch' in event:
+        logger.info(f"Dispatching {len(event['batch'])} region invocations")
+        return dispatch_batch(event['batch'], context.function_name)
+
     try:
         logger.info("=" * 80)
         logger.info("Lambda Container Handler - Self-Contained Architecture")
@@ -19,14 +19,37 @@
 """
 import os
 import logging
+import logging.handlers
 import argparse
 import subprocess
 import configparser
 import time
 import json
+import functools
+import types
+import math
+import random
+import asyncio
+import itertools
+import importlib.util
+import threading
 import concurrent.futures
 from pathlib import Path
 
+# Optional faster JSON encoder for invocation payloads; both paths yield compact UTF-8 bytes
+try:
+    import orjson
+    
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# Default upper bound on concurrent Lambda submission workers (one region per Lambda invocation);
+# overridden per run by --max-concurrent-invocations
+LAMBDA_MAX_WORKERS = 100
+
 # Set up command line argument parser for AWS-specific options
 parser = argparse.ArgumentParser(description='Submit satellite data processing jobs to AWS cloud services')
 parser.add_argument('--config', help='Path to configuration file', type=str, default='../../config.ini')
@@ -44,48 +67,253 @@ parser.add_argument('--instance-type', help='EC2 instance type for compute', typ
 parser.add_argument('--spot-instances', help='Use spot instances for cost savings', action='store_true')
 parser.add_argument('--dry-run', help='Generate configuration but do not submit (true/false)', type=str, choices=['true', 'false'], default=None)
 parser.add_argument('--email', help='Email for job notifications (via SNS)', type=str)
+parser.add_argument('--notify', help='Publish each asynchronous Lambda result to the SNS topic in aws_config.ini and subscribe --email to it', action='store_true')
+parser.add_argument('--fanout', help='Lambda fan-out: flat invokes every region from here; tree invokes ~sqrt(N) dispatchers that each invoke their share of regions; eventbridge publishes 10 region events per PutEvents call to a rule targeting the function', type=str, choices=['flat', 'tree', 'eventbridge'], default='flat')
+parser.add_argument('--max-concurrent-invocations', help=f'Upper bound on in-flight Lambda submissions (threads or asyncio tasks) (default: {LAMBDA_MAX_WORKERS})', type=int, default=LAMBDA_MAX_WORKERS)
 parser.add_argument('--setup', help='Run AWS resource setup (create S3 bucket, etc.)', action='store_true')
+parser.add_argument('--deep-check', help='Verify S3 bucket access (HeadBucket + ListObjectsV2) before submitting', action='store_true')
+parser.add_argument('--update-cache', help='Ignore cached AWS pre-flight checks (credentials, service access) and refresh them', action='store_true')
 
 args = parser.parse_args()
+if args.max_concurrent_invocations < 1:
+    parser.error('--max-concurrent-invocations must be at least 1')
 
 # Get absolute path to current script directory
 script_dir = Path(__file__).resolve().parent
 print(f"AWS Script directory: {script_dir}")
 
+# Glacier ROI geopackage; its 'region' attribute defines the region order used by --start_end_index
+GLACIER_REGIONS_GPKG = script_dir.parent.parent / '1_download_merge_and_clip' / 'ancillary' / 'glacier_roi_v2' / 'glaciers_roi_proj_v3_300m.gpkg'
+
+# One boto3 session (shared credential resolver) and its clients keyed by (service, aws_region)
+_SESSION = None
+_CLIENTS = {}
+_CLIENTS_LOCK = threading.Lock()  # creating clients from a boto3 session is not thread-safe
+
+
+def _env_int(name, default):
+    """Integer from an environment variable; unset or non-integer values fall back to default"""
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+# Adaptive retry mode adds client-side rate limiting plus jittered exponential backoff on throttling.
+# An explicit Config overrides botocore's own env lookup, so the standard AWS_RETRY_MODE/AWS_MAX_ATTEMPTS are honoured here.
+# AWS_MAX_ATTEMPTS counts the first call too, so it maps to total_max_attempts (botocore's max_attempts counts retries only).
+BOTO_CLIENT_CONFIG = {
+    'retries': {
+        'total_max_attempts': _env_int('AWS_MAX_ATTEMPTS', 11),  # default: first call + 10 retries
+        'mode': os.getenv('AWS_RETRY_MODE', 'adaptive'),
+    },
+    'connect_timeout': 5,
+    'read_timeout': 65,
+    'max_pool_connections': max(64, args.max_concurrent_invocations),  # >= fan-out width so workers never queue for a connection
+}
+
+# Credential resolution (IMDS/SSO/assume-role) is retried separately with Fibonacci backoff
+MAX_CREDENTIAL_RETRIES = 5
+
+# In-process sts:GetCallerIdentity results: {profile: (monotonic timestamp, response)}
+_IDENTITY_CACHE = {}
+IDENTITY_CACHE_TTL = 900  # seconds (15 minutes)
+
+# Orchestration stops submitting after this many failures in a row (see FailureGuard);
+# SKIPPED marks regions that were never submitted because of it
+MAX_CONSECUTIVE_FAILURES = 10
+SKIPPED = 'skipped'
+
+# EventBridge fan-out (--fanout eventbridge): a rule matching this source/detail-type targets the Lambda function
+EVENTBRIDGE_SOURCE = 'glacier.orchestrator'
+EVENTBRIDGE_DETAIL_TYPE = 'invoke'
+EVENTBRIDGE_BATCH_SIZE = 10  # PutEvents limit per request
+MAX_PUT_EVENTS_ATTEMPTS = 3
+PUT_EVENTS_BACKOFF_BASE = 1  # seconds; retry delay is min(cap, base * 2**attempt) with +/-50% jitter
+PUT_EVENTS_BACKOFF_CAP = 30
+RETRYABLE_PUT_EVENTS_ERRORS = {'ThrottlingException', 'InternalException', 'InternalFailure', 'ServiceUnavailable'}
+
+# Fallback AWS settings when aws_config.ini is missing or unreadable (us-west-2 for satellite data)
+AWS_CONFIG_DEFAULTS = {
+    's3_bucket': 'greenland-glacier-data',
+    's3_base_path': '1_download_merge_and_clip',
+    'aws_region': 'us-west-2',
+    'lambda_function_name': 'glacier-processing',
+    'lambda_memory_size': 8192,
+    'lambda_timeout': 900,
+    'lambda_ephemeral_storage': 10240,
+    'sns_topic_arn': None
+}
+
+# Successful pre-flight checks (STS identity, service access) are cached on disk to skip network round trips
+PRECHECK_CACHE_FILE = Path.home() / '.cache' / 'greenland-glacier' / 'aws_precheck.json'
+RESOLVER_CACHE_DURATION = 86400  # seconds (24 hours); refresh early with --update-cache
+
 
 def mkdir_p(folder):
-    '''Create directory if it doesn't exist'''
-    if not os.path.exists(folder):
-        os.makedirs(folder, exist_ok=True)
+    '''Create directory if it doesn't exist (makedirs with exist_ok is already idempotent)'''
+    os.makedirs(folder, exist_ok=True)
+
+
+def setup_logging(log_dir):
+    '''Attach the submission log file handler once per process'''
+    if logging.getLogger().handlers:
+        return
+    mkdir_p(log_dir)
+    file_handler = logging.FileHandler(f'{log_dir}/aws_job_submission.log')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s:%(levelname)s:%(message)s'))
+    # Buffer records so worker threads don't contend on the file; errors and logging.shutdown() flush
+    logging.basicConfig(
+        level=logging.INFO, 
+        handlers=[logging.handlers.MemoryHandler(capacity=100, flushLevel=logging.ERROR, target=file_handler)]
+    )
 
 
-def check_aws_credentials():
-    """Check if AWS credentials are configured and valid"""
+def batched(iterable, n):
+    '''Yield successive n-sized tuples from iterable (same as itertools.batched in Python 3.12+)'''
+    it = iter(iterable)
+    while chunk := tuple(itertools.islice(it, n)):
+        yield chunk
+
+
+def aioboto3_available():
+    """Return True if the optional aioboto3 package is installed (enables asyncio Lambda fan-out)"""
+    return importlib.util.find_spec('aioboto3') is not None
+
+
+def boto3_available():
+    """Return True if boto3 is installed, without paying its import cost"""
+    return importlib.util.find_spec('boto3') is not None
+
+
+def _cached_botocore_session():
+    """Return a botocore session whose assume-role credentials persist in ~/.aws/boto/cache
+    
+    Same on-disk cache the AWS CLI uses, so role-based profiles skip sts:AssumeRole on
+    later runs until the temporary credentials expire.
+    """
+    import botocore.session
+    from botocore.credentials import JSONFileCache
+    
+    session = botocore.session.Session()
+    session.get_component('credential_provider').get_provider('assume-role').cache = JSONFileCache()
+    return session
+
+
+def _get_client(service, aws_region=None):
+    """Return a cached boto3 client so repeated invocations reuse one connection pool
+    
+    boto3 is imported here, on first client creation, so --help and argument errors stay fast.
+    All clients derive from one Session so credentials are resolved only once per process.
+    """
+    global _SESSION
+    key = (service, aws_region)
+    with _CLIENTS_LOCK:
+        if key not in _CLIENTS:
+            import boto3
+            from botocore.config import Config
+            if _SESSION is None:
+                _SESSION = boto3.session.Session(botocore_session=_cached_botocore_session())
+            _CLIENTS[key] = _SESSION.client(service, region_name=aws_region, config=Config(**BOTO_CLIENT_CONFIG))
+        return _CLIENTS[key]
+
+
+def _get_caller_identity():
+    """Call sts:GetCallerIdentity, retrying transient credential failures with Fibonacci backoff
+    
+    Results are memoised per AWS profile for IDENTITY_CACHE_TTL seconds, so repeated checks
+    within one process cost no STS round trip.
+    """
+    from botocore.exceptions import CredentialRetrievalError, EndpointConnectionError
+    
+    profile = os.getenv('AWS_PROFILE', 'default')
+    cached = _IDENTITY_CACHE.get(profile)
+    if cached and time.monotonic() - cached[0] < IDENTITY_CACHE_TTL:
+        return cached[1]
+    
+    delay, next_delay = 1, 1
+    for attempt in range(1, MAX_CREDENTIAL_RETRIES + 1):
+        try:
+            identity = _get_client('sts').get_caller_identity()
+            _IDENTITY_CACHE[profile] = (time.monotonic(), identity)
+            return identity
+        except (CredentialRetrievalError, EndpointConnectionError) as e:
+            if attempt == MAX_CREDENTIAL_RETRIES:
+                raise
+            print(f"⚠️  Credential lookup failed (attempt {attempt}/{MAX_CREDENTIAL_RETRIES}): {e}. Retrying in {delay}s")
+            time.sleep(delay)
+            delay, next_delay = next_delay, delay + next_delay
+
+
+def load_precheck_cache():
+    """Return cached pre-flight results for the active AWS profile, or {} if missing/expired"""
     try:
-        import boto3
-        sts_client = boto3.client('sts')
-        response = sts_client.get_caller_identity()
+        if time.time() - PRECHECK_CACHE_FILE.stat().st_mtime > RESOLVER_CACHE_DURATION:
+            return {}
+        with open(PRECHECK_CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Identity and access differ per profile; never reuse results across profiles
+    if cache.get('profile') != os.getenv('AWS_PROFILE', 'default'):
+        return {}
+    return cache
+
+
+def save_precheck_cache(cache):
+    """Write pre-flight results to PRECHECK_CACHE_FILE (best effort)"""
+    cache['profile'] = os.getenv('AWS_PROFILE', 'default')
+    cache['ts'] = time.time()
+    try:
+        mkdir_p(PRECHECK_CACHE_FILE.parent)
+        with open(PRECHECK_CACHE_FILE, 'w') as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        print(f"⚠️  Could not write pre-flight cache {PRECHECK_CACHE_FILE}: {e}")
+
+
+def check_aws_credentials(cache=None):
+    """Check if AWS credentials are configured and valid
+    
+    If cache (see load_precheck_cache) already holds the identity, the STS call is skipped;
+    otherwise a successful lookup is stored in it.
+    """
+    cache = {} if cache is None else cache
+    if cache.get('account') and cache.get('arn'):
+        print(f"✅ AWS credentials valid for account: {cache['account']} (cached)")
+        print(f"✅ Using AWS identity: {cache['arn']} (cached)")
+        return True
+    
+    try:
+        response = _get_caller_identity()
         
         print(f"✅ AWS credentials valid for account: {response['Account']}")
         print(f"✅ Using AWS identity: {response['Arn']}")
+        cache['account'] = response['Account']
+        cache['arn'] = response['Arn']
         return True
         
-    except ImportError:
-        print("❌ boto3 not installed")
-        return False
     except Exception as e:
         print(f"❌ AWS credentials invalid: {e}")
         print("💡 Run: aws configure")
         return False
 
-def check_aws_services(aws_region='us-west-2'):
-    """Check access to AWS Lambda service"""
+def check_aws_services(aws_region='us-west-2', cache=None):
+    """Check access to AWS Lambda service
+    
+    Uses cache['services'][aws_region] when present; full access results are stored back into cache.
+    """
+    cache = {} if cache is None else cache
+    cached_services = cache.get('services', {}).get(aws_region)
+    if cached_services:
+        print(f"✅ AWS Lambda access available in {aws_region} (cached)")
+        return cached_services
+    
     try:
-        import boto3
+        lambda_client = _get_client('lambda', aws_region)
         
         # Check Lambda service access
         try:
-            lambda_client = boto3.client('lambda', region_name=aws_region)
             # Simple check - list functions (will fail if no access)
             lambda_client.list_functions(MaxItems=1)
             print(f"✅ AWS Lambda access available in {aws_region}")
@@ -93,12 +321,12 @@ def check_aws_services(aws_region='us-west-2'):
         except Exception as e:
             print(f"⚠️  AWS Lambda limited access: {e}")
             lambda_access = False
-            
-        return {'lambda': lambda_access}
         
-    except ImportError:
-        print("❌ boto3 not installed")
-        return {'lambda': False}
+        service_access = {'lambda': lambda_access}
+        if all(service_access.values()):
+            cache.setdefault('services', {})[aws_region] = service_access
+        return service_access
+        
     except Exception as e:
         print(f"❌ AWS service check failed: {e}")
         return {'lambda': False}
@@ -111,8 +339,7 @@ def setup_aws_resources(s3_bucket, aws_region='us-west-2'):
     # Try to create S3 bucket
     print(f"1. Creating S3 bucket: {s3_bucket}")
     try:
-        import boto3
-        s3_client = boto3.client('s3', region_name=aws_region)
+        s3_client = _get_client('s3', aws_region)
         
         if aws_region == 'us-east-1':
             # us-east-1 doesn't need LocationConstraint
@@ -132,24 +359,40 @@ def setup_aws_resources(s3_bucket, aws_region='us-west-2'):
         return False
 
 
-def test_s3_access(s3_bucket, aws_region='us-west-2'):
-    """Test basic S3 access for the specified bucket"""
+def iter_s3_objects(s3_bucket, prefix='', aws_region='us-west-2', max_items=None):
+    """Lazily yield object summaries from an S3 bucket using the list_objects_v2 paginator.
+    
+    A single list_objects_v2 call silently stops at 1000 keys; the paginator follows
+    continuation tokens so callers can enumerate a whole prefix or stop early.
+    """
+    pagination_config = {'MaxItems': max_items, 'PageSize': min(max_items, 1000)} if max_items else {}
+    paginator = _get_client('s3', aws_region).get_paginator('list_objects_v2')
+    pages = paginator.paginate(Bucket=s3_bucket, Prefix=prefix, PaginationConfig=pagination_config)
+    for page in pages:
+        yield from page.get('Contents', [])
+
+
+@functools.lru_cache(maxsize=16)
+def test_s3_access(s3_bucket, aws_region='us-west-2', deep_check=False):
+    """Test basic S3 access for the specified bucket
+    
+    HeadBucket alone distinguishes missing (404) from forbidden (403) buckets, so it is
+    the only request by default. deep_check=True also verifies list permission.
+    The outcome is memoised per (bucket, region, deep_check) for the life of the process.
+    """
     try:
-        import boto3
-        s3_client = boto3.client('s3', region_name=aws_region)
+        s3_client = _get_client('s3', aws_region)
         
         # Test if bucket exists and we can access it
-        response = s3_client.head_bucket(Bucket=s3_bucket)
+        s3_client.head_bucket(Bucket=s3_bucket)
         print(f"✅ S3 bucket '{s3_bucket}' is accessible in {aws_region}")
         
-        # Test listing objects (should work even if bucket is empty)
-        response = s3_client.list_objects_v2(Bucket=s3_bucket, MaxKeys=1)
-        print(f"✅ Can list objects in bucket '{s3_bucket}'")
+        if deep_check:
+            # Test listing objects (should work even if bucket is empty); fetch at most one key
+            next(iter_s3_objects(s3_bucket, aws_region=aws_region, max_items=1), None)
+            print(f"✅ Can list objects in bucket '{s3_bucket}'")
         return True
         
-    except ImportError:
-        print("❌ boto3 not installed")
-        return False
     except Exception as e:
         print(f"❌ S3 bucket '{s3_bucket}' access failed: {e}")
         print(f"💡 Solutions:")
@@ -161,6 +404,68 @@ def test_s3_access(s3_bucket, aws_region='us-west-2'):
         return False
 
 
+def configure_async_notifications(function_name, sns_topic_arn, email=None, aws_region='us-west-2'):
+    """Route asynchronous Lambda results to an SNS topic instead of waiting on them
+    
+    Registers the topic as the OnSuccess/OnFailure destination of the function's
+    asynchronous invocation config. Only the destinations are updated, so tuned
+    retry/event-age settings are kept; the config is created only if the function
+    has none yet. Each Event invocation then publishes its outcome
+    (correlated by the Request ID printed at submission) while the CLI returns
+    immediately. Optionally subscribes an email address to the topic.
+    
+    Requires sns:Publish on the topic for the Lambda execution role.
+    """
+    try:
+        lambda_client = _get_client('lambda', aws_region)
+        destinations = {
+            'OnSuccess': {'Destination': sns_topic_arn},
+            'OnFailure': {'Destination': sns_topic_arn},
+        }
+        try:
+            lambda_client.update_function_event_invoke_config(FunctionName=function_name, DestinationConfig=destinations)
+        except lambda_client.exceptions.ResourceNotFoundException:
+            # No async invoke config yet: create one (put replaces everything, so it is only used here)
+            lambda_client.put_function_event_invoke_config(FunctionName=function_name, DestinationConfig=destinations)
+        print(f"✅ Async results for '{function_name}' will be published to {sns_topic_arn}")
+        
+        if email:
+            # SNS subscribe is idempotent for an existing endpoint
+            _get_client('sns', aws_region).subscribe(TopicArn=sns_topic_arn, Protocol='email', Endpoint=email)
+            print(f"✅ Subscribed {email} to job notifications (confirm via the AWS email if new)")
+        return True
+        
+    except Exception as e:
+        print(f"⚠️  Could not configure SNS notifications: {e}")
+        print(f"💡 Check [NOTIFICATIONS] sns_topic_arn in aws_config.ini and lambda:UpdateFunctionEventInvokeConfig/PutFunctionEventInvokeConfig permissions")
+        logging.warning(f"SNS notification setup failed: {e}")
+        return False
+
+
+def build_lambda_event(region, date1, date2, satellite, **kwargs):
+    """Build the event payload matching lambda_handler.py expectations
+    
+    If kwargs carries an 'event_template' (see orchestrate_lambda_jobs), only the region
+    is filled in; every other field is shared across the orchestration run.
+    """
+    event_template = kwargs.get('event_template')
+    if event_template is not None:
+        return {**event_template, 'region': region}
+    return {
+        'satellite': satellite,
+        'region': region,  # Single region for Lambda processing
+        'date1': date1,        # Updated for parameter reconciliation
+        'date2': date2,          # Updated for parameter reconciliation
+        's3_bucket': kwargs.get('s3_bucket', 'greenland-glacier-data'),
+        's3_base_path': kwargs.get('s3_base_path', '1_download_merge_and_clip'),  # Add S3 base path
+        'download_flag': kwargs.get('download_flag', 1),
+        'post_processing_flag': kwargs.get('post_processing_flag', 1),
+        'cores': kwargs.get('cores', 1),
+        'base_dir': f'/tmp/glacier_processing/{satellite}',  # Lambda ephemeral storage
+        'log_name': kwargs.get('log_name', 'lambda_glacier.log')
+    }
+
+
 def create_aws_lambda_job(jobname, region, date1, date2, satellite, **kwargs):
     """Create and submit AWS Lambda function for satellite processing
     
@@ -174,110 +479,136 @@ def create_aws_lambda_job(jobname, region, date1, date2, satellite, **kwargs):
     - Configured for 8 GB memory (optimal for Sentinel-2 processing)
     - Reads settings from aws/config/aws_config.ini
     """
-    print(f"\n{'='*60}")
-    print(f"AWS LAMBDA JOB SUBMISSION - {satellite.upper()}")
-    print(f"{'='*60}")
-    
     # Get Lambda configuration from aws_config.ini
     function_name = kwargs.get('lambda_function_name', 'glacier-processing')
     s3_bucket = kwargs.get('s3_bucket', 'greenland-glacier-data')
-    s3_base_path = kwargs.get('s3_base_path', '1_download_merge_and_clip')
     aws_region = kwargs.get('aws_region', 'us-west-2')
     memory_size = kwargs.get('lambda_memory_size', 8192)
     timeout = kwargs.get('lambda_timeout', 900)
     
-    # Build event payload matching lambda_handler.py expectations
-    lambda_event = {
-        'satellite': satellite,
-        'region': region,  # Single region for Lambda processing
-        'date1': date1,        # Updated for parameter reconciliation
-        'date2': date2,          # Updated for parameter reconciliation
-        's3_bucket': s3_bucket,
-        's3_base_path': s3_base_path,  # Add S3 base path
-        'download_flag': kwargs.get('download_flag', 1),
-        'post_processing_flag': kwargs.get('post_processing_flag', 1),
-        'cores': kwargs.get('cores', 1),
-        'base_dir': f'/tmp/glacier_processing/{satellite}',  # Lambda ephemeral storage
-        'log_name': kwargs.get('log_name', 'lambda_glacier.log')
-    }
+    lambda_event = build_lambda_event(region, date1, date2, satellite, **kwargs)
     
-    print(f"\nConfiguration:")
-    print(f"  Function: {function_name}")
-    print(f"  Region: {aws_region}")
-    print(f"  Memory: {memory_size} MB")
-    print(f"  Timeout: {timeout} seconds")
-    print(f"  S3 Bucket: {s3_bucket}")
-    print(f"\nProcessing Parameters:")
-    print(f"  Satellite: {satellite}")
-    print(f"  Region: {region}")
-    print(f"  Date Range: {date1} to {date2}")
-    print(f"  Job Name: {jobname}")
-    
-    # Handle dry run mode
-    if kwargs.get('dry_run'):
-        print(f"\n{'='*60}")
-        print("DRY RUN MODE - Lambda configuration validated")
-        print(f"{'='*60}")
-        print("\nEvent payload that would be sent:")
-        print(json.dumps(lambda_event, indent=2))
-        print(f"\n💡 To invoke manually (asynchronous):")
-        print(f"   aws lambda invoke \\")
-        print(f"     --function-name {function_name} \\")
-        print(f"     --invocation-type Event \\")
-        print(f"     --payload '{json.dumps(lambda_event)}' \\")
-        print(f"     --region {aws_region} \\")
-        print(f"     /tmp/lambda_response.json")
-        return
+    # Status lines are buffered and written with a single print so concurrent
+    # submissions neither interleave nor contend on the stdout lock per line
+    out = [
+        f"\n{'='*60}",
+        f"AWS LAMBDA JOB SUBMISSION - {satellite.upper()}",
+        f"{'='*60}",
+        f"\nConfiguration:",
+        f"  Function: {function_name}",
+        f"  Region: {aws_region}",
+        f"  Memory: {memory_size} MB",
+        f"  Timeout: {timeout} seconds",
+        f"  S3 Bucket: {s3_bucket}",
+        f"\nProcessing Parameters:",
+        f"  Satellite: {satellite}",
+        f"  Region: {region}",
+        f"  Date Range: {date1} to {date2}",
+        f"  Job Name: {jobname}",
+    ]
+    
+    # Serialize the event once; the same compact bytes are the invoke Payload and the CLI hint
+    payload = _dumps(lambda_event)
     
-    # Invoke Lambda function
     try:
-        import boto3
-        lambda_client = boto3.client('lambda', region_name=aws_region)
-        
-        print(f"\n{'='*60}")
-        print("INVOKING LAMBDA FUNCTION")
-        print(f"{'='*60}")
-        
-        # Asynchronous invocation - fire and forget (better for long-running functions)
-        response = lambda_client.invoke(
-            FunctionName=function_name,
-            InvocationType='Event',  # Asynchronous - don't wait for result
-            Payload=json.dumps(lambda_event)
-        )
-        
-        # Parse response
-        status_code = response['StatusCode']
-        
-        print(f"\n✅ Lambda function invoked successfully!")
-        print(f"   Status Code: {status_code}")
-        print(f"   Request ID: {response['ResponseMetadata']['RequestId']}")
-        print(f"   Invocation Type: Asynchronous (Event)")
-        print(f"\n💡 Function is running in background. Check CloudWatch logs or S3 for results:")
-        print(f"   Logs: https://{aws_region}.console.aws.amazon.com/cloudwatch/home?region={aws_region}#logsV2:log-groups/log-group/$252Faws$252Flambda$252F{function_name.replace('-', '$252D')}")
-        print(f"   S3: s3://{s3_bucket}/1_download_merge_and_clip/{satellite}/")
+        # Handle dry run mode
+        if kwargs.get('dry_run'):
+            out += [
+                f"\n{'='*60}",
+                "DRY RUN MODE - Lambda configuration validated",
+                f"{'='*60}",
+                "\nEvent payload that would be sent:",
+                json.dumps(lambda_event, indent=2),
+                f"\n💡 To invoke manually (asynchronous):",
+                f"   aws lambda invoke \\",
+                f"     --function-name {function_name} \\",
+                f"     --invocation-type Event \\",
+                f"     --payload '{payload.decode()}' \\",
+                f"     --region {aws_region} \\",
+                f"     /tmp/lambda_response.json",
+            ]
+            return
         
-        return True
-        
-        # Log to file
-        logging.info(f"Lambda invocation: {function_name}, Job: {jobname}, Status: {status_code}")
-        
-        print(f"\n{'='*60}")
-        return response
-        
-    except ImportError:
-        print(f"\n❌ ERROR: boto3 not installed")
-        print(f"💡 Install: pip install boto3")
-        return None
-        
-    except Exception as e:
-        print(f"\n❌ Lambda invocation failed: {e}")
-        print(f"\n💡 Troubleshooting:")
-        print(f"   1. Verify function exists: aws lambda get-function --function-name {function_name}")
-        print(f"   2. Check AWS credentials: aws sts get-caller-identity")
-        print(f"   3. Verify region: {aws_region}")
-        print(f"   4. Check CloudWatch logs: /aws/lambda/{function_name}")
-        logging.error(f"Lambda invocation failed: {e}")
-        return None
+        # Invoke Lambda function
+        try:
+            lambda_client = _get_client('lambda', aws_region)
+            
+            out += [
+                f"\n{'='*60}",
+                "INVOKING LAMBDA FUNCTION",
+                f"{'='*60}",
+            ]
+            
+            # Asynchronous invocation - fire and forget (better for long-running functions)
+            response = lambda_client.invoke(
+                FunctionName=function_name,
+                InvocationType='Event',  # Asynchronous - don't wait for result
+                Payload=payload
+            )
+            
+            # Parse response
+            status_code = response['StatusCode']
+            
+            out += [
+                f"\n✅ Lambda function invoked successfully!",
+                f"   Status Code: {status_code}",
+                f"   Request ID: {response['ResponseMetadata']['RequestId']}",
+                f"   Invocation Type: Asynchronous (Event)",
+                f"\n💡 Function is running in background. Check CloudWatch logs or S3 for results:",
+                f"   Logs: https://{aws_region}.console.aws.amazon.com/cloudwatch/home?region={aws_region}#logsV2:log-groups/log-group/$252Faws$252Flambda$252F{function_name.replace('-', '$252D')}",
+                f"   S3: s3://{s3_bucket}/1_download_merge_and_clip/{satellite}/",
+            ]
+            
+            # Log to file
+            logging.info(f"Lambda invocation: {function_name}, Job: {jobname}, Status: {status_code}")
+            
+            out.append(f"\n{'='*60}")
+            return response
+            
+        except Exception as e:
+            out += [
+                f"\n❌ Lambda invocation failed: {e}",
+                f"\n💡 Troubleshooting:",
+                f"   1. Verify function exists: aws lambda get-function --function-name {function_name}",
+                f"   2. Check AWS credentials: aws sts get-caller-identity",
+                f"   3. Verify region: {aws_region}",
+                f"   4. Check CloudWatch logs: /aws/lambda/{function_name}",
+            ]
+            logging.error(f"Lambda invocation failed: {e}")
+            return None
+    finally:
+        print("\n".join(out))
+
+def _str_to_bool(value):
+    '''Convert an INI boolean string (true/false, yes/no, on/off, 1/0) the way ConfigParser.getboolean does'''
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[str(value).lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}")
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_ini(path, mtime_ns):
+    '''Parse path into read-only {section: {key: value}} views; mtime_ns keys the cache so edits are picked up'''
+    config = configparser.ConfigParser()
+    files_read = config.read(path)
+    sections = {section: types.MappingProxyType(dict(config.items(section))) for section in config.sections()}
+    return types.MappingProxyType(sections), tuple(files_read)
+
+
+def read_ini(config_file):
+    """Parse an INI file once into plain nested mappings
+    
+    Returns ({section: {key: value}}, files_read). Lookups on the plain mappings skip
+    configparser's per-get interpolation and option-name folding. Parses are memoised
+    per (absolute path, mtime), so repeated loads of an unchanged file are free.
+    """
+    path = os.path.abspath(config_file)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return types.MappingProxyType({}), ()
+    return _parse_ini(path, mtime_ns)
 
 
 def load_aws_config(aws_config_file="../config/aws_config.ini"):
@@ -291,93 +622,123 @@ def load_aws_config(aws_config_file="../config/aws_config.ini"):
     - Cost optimization preferences
     """
     try:
-        config = configparser.ConfigParser()
-        files_read = config.read(aws_config_file)
+        ini, files_read = read_ini(aws_config_file)
         if not files_read:
             print(f"⚠️  Warning: AWS config file not found at {aws_config_file}, using defaults")
         else:
             print(f"✅ Loaded AWS config from: {files_read[0]}")
         
+        storage = ini.get("STORAGE", {})
+        account = ini.get("AWS_ACCOUNT", {})
+        lambda_cfg = ini.get("LAMBDA", {})
+        notifications = ini.get("NOTIFICATIONS", {})
         return {
             # Storage settings
-            's3_bucket': config.get("STORAGE", "s3_bucket", fallback='greenland-glacier-data'),
-            's3_base_path': config.get("STORAGE", "s3_base_path", fallback='1_download_merge_and_clip'),
+            's3_bucket': storage.get("s3_bucket", AWS_CONFIG_DEFAULTS['s3_bucket']),
+            's3_base_path': storage.get("s3_base_path", AWS_CONFIG_DEFAULTS['s3_base_path']),
             
             # AWS account settings
-            'aws_region': config.get("AWS_ACCOUNT", "aws_region", fallback='us-west-2'),
+            'aws_region': account.get("aws_region", AWS_CONFIG_DEFAULTS['aws_region']),
             
             # Lambda settings
-            'lambda_function_name': config.get("LAMBDA", "function_name", fallback='glacier-processing'),
-            'lambda_memory_size': config.getint("LAMBDA", "memory_size", fallback=8192),
-            'lambda_timeout': config.getint("LAMBDA", "timeout", fallback=900),
-            'lambda_ephemeral_storage': config.getint("LAMBDA", "ephemeral_storage", fallback=10240)
+            'lambda_function_name': lambda_cfg.get("function_name", AWS_CONFIG_DEFAULTS['lambda_function_name']),
+            'lambda_memory_size': int(lambda_cfg.get("memory_size", AWS_CONFIG_DEFAULTS['lambda_memory_size'])),
+            'lambda_timeout': int(lambda_cfg.get("timeout", AWS_CONFIG_DEFAULTS['lambda_timeout'])),
+            'lambda_ephemeral_storage': int(lambda_cfg.get("ephemeral_storage", AWS_CONFIG_DEFAULTS['lambda_ephemeral_storage'])),
+            
+            # Notification settings
+            'sns_topic_arn': notifications.get("sns_topic_arn", AWS_CONFIG_DEFAULTS['sns_topic_arn'])
         }
     except Exception as e:
         print(f"Warning: Could not load AWS config file {aws_config_file}: {e}")
-        # Return default values with us-west-2 for satellite data
-        return {
-            's3_bucket': 'greenland-glacier-data',
-            's3_base_path': '1_download_merge_and_clip',
-            'aws_region': 'us-west-2',
-            'lambda_function_name': 'glacier-processing',
-            'lambda_memory_size': 8192,
-            'lambda_timeout': 900,
-            'lambda_ephemeral_storage': 10240
-        }
+        return dict(AWS_CONFIG_DEFAULTS)
+
+
+@functools.lru_cache(maxsize=1)
+def get_full_region_list():
     """Get the full list of glacier regions from the geopackage file.
     
+    Only the 'region' attribute is read (no geometry decoding), and the result is cached
+    for the life of the process.
+    
     Returns:
-        list: Sorted list of region names (e.g., ['001_region1', '002_region2', ...])
+        tuple: Sorted region names (e.g., ('001_region1', '002_region2', ...))
     """
     try:
-        import geopandas as gpd
-        # Path relative to the AWS script location
-        script_dir = Path(__file__).resolve().parent
-        glacier_regions_path = script_dir.parent.parent / '1_download_merge_and_clip' / 'ancillary' / 'glacier_roi_v2' / 'glaciers_roi_proj_v3_300m.gpkg'
-        
-        regions_gdf = gpd.read_file(glacier_regions_path)
-        regions_gdf.index = regions_gdf.region
-        regions_gdf = regions_gdf.sort_index()
+        try:
+            import pyogrio
+            regions_df = pyogrio.read_dataframe(GLACIER_REGIONS_GPKG, columns=['region'], read_geometry=False)
+        except ImportError:
+            import geopandas as gpd
+            regions_df = gpd.read_file(GLACIER_REGIONS_GPKG, columns=['region'], ignore_geometry=True)
         
-        return regions_gdf.index.tolist()
+        return tuple(sorted(regions_df['region']))
     except Exception as e:
         print(f"Error loading region list: {e}")
         # Fallback: return empty list or raise error
         raise RuntimeError("Could not load glacier regions list. Ensure the geopackage file exists.")
 
 
+def get_region_slice(start, end):
+    """Return sorted regions[start:end], reading only the requested rows when possible
+    
+    With pyogrio, GDAL sorts and pages the attribute table (ORDER BY/LIMIT/OFFSET), so a
+    25-of-500 slice decodes 25 features. Negative indices, a missing pyogrio, or an
+    already-cached full list use get_full_region_list() instead.
+    """
+    if start >= 0 and end >= start and not get_full_region_list.cache_info().currsize:
+        try:
+            import pyogrio
+        except ImportError:
+            pass
+        else:
+            try:
+                layer = pyogrio.list_layers(GLACIER_REGIONS_GPKG)[0][0]
+                regions_df = pyogrio.read_dataframe(
+                    GLACIER_REGIONS_GPKG,
+                    sql=f'SELECT region FROM "{layer}" ORDER BY region LIMIT {end - start} OFFSET {start}',
+                    read_geometry=False
+                )
+                return list(regions_df['region'])
+            except Exception as e:
+                print(f"Error loading region list: {e}")
+                raise RuntimeError("Could not load glacier regions list. Ensure the geopackage file exists.")
+    return list(get_full_region_list()[start:end])
+
+
 def load_shared_config(config_file="../../config.ini", cli_args=None):
     """Load shared configuration from the main config file
     
     Reuses the same configuration structure as the main script
     """
-    config = configparser.ConfigParser()
-    config.read(config_file)
+    ini, _ = read_ini(config_file)
+    regions_cfg, dates, paths = ini["REGIONS"], ini["DATES"], ini["PATHS"]
+    flags, settings = ini.get("FLAGS", {}), ini["SETTINGS"]
     
     # Parse configuration values from sections (same as main script)
     config_dict = {
         # Region settings
-        'regions': config.get("REGIONS", "regions"),
-        'start_end_index': config.get("REGIONS", "start_end_index"),
+        'regions': regions_cfg["regions"],
+        'start_end_index': regions_cfg["start_end_index"],
         
         # Date settings
-        'date1': config.get("DATES", "date1"),
-        'date2': config.get("DATES", "date2"),
+        'date1': dates["date1"],
+        'date2': dates["date2"],
         
         # Path settings (will be adapted for S3)
-        'base_dir': config.get("PATHS", "base_dir"),
+        'base_dir': paths["base_dir"],
 
         # Processing flags
-        'download_flag': config.getint("FLAGS", "download_flag", fallback=1),
-        'post_processing_flag': config.getint("FLAGS", "post_processing_flag", fallback=1),
-        'clear_downloads': config.getint("FLAGS", "clear_downloads", fallback=0),
+        'download_flag': int(flags.get("download_flag", 1)),
+        'post_processing_flag': int(flags.get("post_processing_flag", 1)),
+        'clear_downloads': int(flags.get("clear_downloads", 0)),
         
         # General settings
-        'cores': config.getint("SETTINGS", "cores", fallback=1),
-        'log_name': config.get("SETTINGS", "log_name"),
-        'email': config.get("SETTINGS", "email"),
-        'satellite': config.get("SETTINGS", "satellite"),
-        'dry_run': config.getboolean("SETTINGS", "dry_run", fallback=False)
+        'cores': int(settings.get("cores", 1)),
+        'log_name': settings["log_name"],
+        'email': settings["email"],
+        'satellite': settings["satellite"],
+        'dry_run': _str_to_bool(settings.get("dry_run", False))
     }
     
     # Override with command line arguments
@@ -415,20 +776,196 @@ def load_shared_config(config_file="../../config.ini", cli_args=None):
         # Parse start:end index and slice the full region list
         try:
             start, end = map(int, start_end_index.split(':'))
-            full_regions = get_full_region_list()
-            regions_list = full_regions[start:end]
+            regions_list = get_region_slice(start, end)
         except ValueError:
             raise ValueError(f"Invalid start_end_index format: {start_end_index}. Use 'start:end' (e.g., '0:25')")
     else:
         # Default: all regions
-        regions_list = get_full_region_list()
+        regions_list = list(get_full_region_list())
     
     config_dict['regions_list'] = regions_list
     
     return config_dict
 
 
-def orchestrate_lambda_jobs(regions_list, date1, date2, satellite, job_kwargs, aws_cfg, dry_run):
+class FailureGuard:
+    """Trip once `limit` submissions in a row have failed, across all worker threads/tasks
+    
+    Workers check `tripped` before each submission and report SKIPPED instead of spending
+    their retry budget on a failure that is clearly not region-specific.
+    """
+    
+    def __init__(self, limit=MAX_CONSECUTIVE_FAILURES):
+        self.limit = limit
+        self.tripped = threading.Event()
+        self._consecutive = 0
+        self._lock = threading.Lock()
+    
+    def record(self, ok):
+        with self._lock:
+            self._consecutive = 0 if ok else self._consecutive + 1
+            if self._consecutive >= self.limit and not self.tripped.is_set():
+                self.tripped.set()
+                print(f"🛑 {self._consecutive} consecutive submission failures - skipping remaining regions")
+
+
+def _invoke_region_batch(batch, date1, date2, satellite, job_kwargs):
+    """Invoke one Lambda function per (jobname, region) pair in batch.
+    
+    Runs inside a worker thread; failures are recorded per region so one bad
+    invocation does not abort the rest of the batch, unless the shared
+    failure_guard has tripped.
+    """
+    guard = job_kwargs.get('failure_guard')
+    results = []
+    for jobname, region in batch:
+        if guard is not None and guard.tripped.is_set():
+            results.append((region, SKIPPED))
+            continue
+        try:
+            result = create_aws_lambda_job(jobname, region, date1, date2, satellite, **job_kwargs.copy())
+        except Exception as exc:
+            print(f"❌ Failed: {region} - {exc}")
+            result = None
+        if guard is not None:
+            guard.record(result is not None)
+        results.append((region, result))
+    return results
+
+
+async def _invoke_one(lambda_client, semaphore, function_name, payload, guard=None):
+    """Fire one asynchronous (Event) invocation, holding a semaphore slot while the request is in flight"""
+    async with semaphore:
+        if guard is not None and guard.tripped.is_set():
+            return SKIPPED
+        try:
+            await lambda_client.invoke(FunctionName=function_name, InvocationType='Event', Payload=payload)
+        except Exception:
+            if guard is not None:
+                guard.record(False)
+            raise
+    if guard is not None:
+        guard.record(True)
+    return True
+
+
+async def _orchestrate_async(lambda_invocations, date1, date2, satellite, job_kwargs, concurrency=LAMBDA_MAX_WORKERS):
+    """Invoke every region from a single event loop using aioboto3
+    
+    Event invocations are pure network I/O, so one shared async client with a bounded
+    number of in-flight requests replaces the worker threads. Returns (region, result)
+    pairs in the same shape as _invoke_region_batch.
+    """
+    import aioboto3
+    from botocore.config import Config
+    
+    function_name = job_kwargs.get('lambda_function_name', 'glacier-processing')
+    aws_region = job_kwargs.get('aws_region', 'us-west-2')
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    session = aioboto3.Session()
+    async with session.client('lambda', region_name=aws_region, config=Config(**BOTO_CLIENT_CONFIG)) as lambda_client:
+        tasks = [
+            asyncio.create_task(_invoke_one(
+                lambda_client, semaphore, function_name,
+                _dumps(build_lambda_event(region, date1, date2, satellite, **job_kwargs)),
+                job_kwargs.get('failure_guard')
+            ))
+            for _, region in lambda_invocations
+        ]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    results = []
+    for (jobname, region), outcome in zip(lambda_invocations, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ Failed: {region} - {outcome}")
+            logging.error(f"Lambda invocation failed: {jobname} - {outcome}")
+            results.append((region, None))
+        else:
+            if outcome is not SKIPPED:
+                logging.info(f"Lambda invocation: {function_name}, Job: {jobname}")
+            results.append((region, outcome))
+    return results
+
+
+def _invoke_dispatch_group(group, date1, date2, satellite, job_kwargs):
+    """Invoke the Lambda function once with {"batch": [...]} so it re-invokes itself for each region in group
+    
+    Success only means the dispatcher was queued; each region in the group shares that outcome.
+    """
+    guard = job_kwargs.get('failure_guard')
+    if guard is not None and guard.tripped.is_set():
+        return [(region, SKIPPED) for _, region in group]
+    
+    function_name = job_kwargs.get('lambda_function_name', 'glacier-processing')
+    dispatch_event = {'batch': [build_lambda_event(region, date1, date2, satellite, **job_kwargs) for _, region in group]}
+    try:
+        _get_client('lambda', job_kwargs.get('aws_region', 'us-west-2')).invoke(
+            FunctionName=function_name,
+            InvocationType='Event',
+            Payload=_dumps(dispatch_event)
+        )
+        logging.info(f"Lambda dispatch: {function_name}, Jobs: {[jobname for jobname, _ in group]}")
+        result = True
+    except Exception as exc:
+        print(f"❌ Dispatch failed: {[region for _, region in group]} - {exc}")
+        logging.error(f"Lambda dispatch failed: {exc}")
+        result = None
+    if guard is not None:
+        guard.record(result is not None)
+    return [(region, result) for _, region in group]
+
+
+def _put_events_group(group, date1, date2, satellite, job_kwargs):
+    """Publish up to EVENTBRIDGE_BATCH_SIZE region events in one PutEvents call
+    
+    Entries rejected with a transient ErrorCode (throttling/internal) are resubmitted on their
+    own with jittered exponential backoff, up to MAX_PUT_EVENTS_ATTEMPTS times; any other
+    ErrorCode fails that entry immediately. Call-level throttling is left to botocore's
+    adaptive retries (BOTO_CLIENT_CONFIG).
+    """
+    guard = job_kwargs.get('failure_guard')
+    if guard is not None and guard.tripped.is_set():
+        return [(region, SKIPPED) for _, region in group]
+    
+    events_client = _get_client('events', job_kwargs.get('aws_region', 'us-west-2'))
+    pending = [
+        (region, {
+            'Source': EVENTBRIDGE_SOURCE,
+            'DetailType': EVENTBRIDGE_DETAIL_TYPE,
+            'Detail': _dumps(build_lambda_event(region, date1, date2, satellite, **job_kwargs)).decode()  # PutEvents takes a str
+        })
+        for _, region in group
+    ]
+    rejected = []
+    for attempt in range(1, MAX_PUT_EVENTS_ATTEMPTS + 1):
+        try:
+            response = events_client.put_events(Entries=[entry for _, entry in pending])
+        except Exception as exc:
+            print(f"❌ PutEvents failed: {[region for region, _ in pending]} - {exc}")
+            logging.error(f"EventBridge PutEvents failed: {exc}")
+            break
+        if not response.get('FailedEntryCount'):
+            pending = []
+            break
+        # Result entries are in request order; failed ones carry an ErrorCode
+        failed_entries = [(item, result['ErrorCode']) for item, result in zip(pending, response['Entries']) if 'ErrorCode' in result]
+        pending = [item for item, code in failed_entries if code in RETRYABLE_PUT_EVENTS_ERRORS]
+        rejected += [item for item, code in failed_entries if code not in RETRYABLE_PUT_EVENTS_ERRORS]
+        if not pending:
+            break
+        if attempt < MAX_PUT_EVENTS_ATTEMPTS:
+            time.sleep(min(PUT_EVENTS_BACKOFF_CAP, PUT_EVENTS_BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5))
+    
+    failed = {region for region, _ in pending + rejected}
+    if failed:
+        logging.error(f"EventBridge entries not accepted: {sorted(failed)}")
+    if guard is not None:
+        guard.record(len(failed) < len(group))
+    return [(region, None if region in failed else True) for _, region in group]
+
+
+def orchestrate_lambda_jobs(regions_list, date1, date2, satellite, job_kwargs, aws_cfg, dry_run, fanout='flat', max_workers=LAMBDA_MAX_WORKERS):
     """Orchestrate multiple Lambda function invocations for multiple regions.
     
     This function handles the orchestration of multiple Lambda functions,
@@ -438,53 +975,113 @@ def orchestrate_lambda_jobs(regions_list, date1, date2, satellite, job_kwargs, a
     print(f"ORCHESTRATING {len(regions_list)} LAMBDA FUNCTIONS")
     print(f"{'='*70}")
     
+    # An empty selection (e.g. --start_end_index past the last region) has nothing to fan out
+    if not regions_list:
+        print("No regions to process - check --regions/--start_end_index")
+        logging.warning("No regions to process")
+        return
+    
+    # Job names differ only by region suffix
+    jobname_prefix = f"aws-{satellite}-{date1.replace('-', '')}"
+    
     if dry_run:
         print("DRY RUN MODE - Would invoke the following Lambda functions:")
         for i, region in enumerate(regions_list):
-            jobname = f"aws-{satellite}-{date1.replace('-', '')}-{region}"
-            print(f"  {i+1:2d}. Region: {region}, Job: {jobname}")
+            print(f"  {i+1:2d}. Region: {region}, Job: {jobname_prefix}-{region}")
         print(f"\n💡 To run for real, remove --dry-run true")
         return
     
-    # Prepare arguments for each Lambda invocation
-    lambda_invocations = []
-    for region in regions_list:
-        jobname = f"aws-{satellite}-{date1.replace('-', '')}-{region}"
-        args = (jobname, region, date1, date2, satellite)
-        kwargs = job_kwargs.copy()
-        lambda_invocations.append((args, kwargs))
+    # Prepare (jobname, region) pairs; the Lambda handler processes a single region per invocation
+    lambda_invocations = [(f"{jobname_prefix}-{region}", region) for region in regions_list]
     
-    print(f"Invoking {len(lambda_invocations)} Lambda functions concurrently...")
+    # Every field except the region is identical across this run; build it once
+    job_kwargs = {**job_kwargs, 'event_template': build_lambda_event(None, date1, date2, satellite, **job_kwargs)}
     
-    # Use ThreadPoolExecutor for concurrent invocations
-    results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:  # Limit to 10 concurrent to avoid overwhelming AWS
-        future_to_region = {
-            executor.submit(create_aws_lambda_job, *args, **kwargs): region 
-            for (args, kwargs), region in zip(lambda_invocations, regions_list)
-        }
+    # Shared across workers: after MAX_CONSECUTIVE_FAILURES failures in a row, remaining regions are skipped
+    job_kwargs['failure_guard'] = FailureGuard()
+    
+    # Running tally, updated as results arrive
+    successful = 0
+    failed_regions = []
+    skipped_regions = []
+    
+    def record(results, verb):
+        """Tally one completed batch and report its successes with a single write"""
+        nonlocal successful
+        done = []
+        for region, result in results:
+            if result is SKIPPED:
+                skipped_regions.append(region)
+            elif result is not None:
+                done.append(region)
+            else:
+                failed_regions.append(region)
+        successful += len(done)
+        if done:
+            msg = "\n".join(f"✅ {verb}: {region}" for region in done)
+            print(msg)
+            logging.info(msg)
+    
+    if fanout in ('tree', 'eventbridge'):
+        if fanout == 'tree':
+            # Two-level fan-out: ~sqrt(N) dispatcher invocations, each re-invoking the function for ~sqrt(N) regions
+            group_size = math.isqrt(len(lambda_invocations) - 1) + 1  # ceil(sqrt(N))
+            submit_group, service = _invoke_dispatch_group, 'lambda'
+            via = "dispatcher invocations"
+        else:
+            # EventBridge rule targets the function; one PutEvents call carries up to 10 region events
+            group_size = EVENTBRIDGE_BATCH_SIZE
+            submit_group, service = _put_events_group, 'events'
+            via = "EventBridge PutEvents calls"
+        groups = list(batched(lambda_invocations, group_size))
         
-        for future in concurrent.futures.as_completed(future_to_region):
-            region = future_to_region[future]
-            try:
-                result = future.result()
-                results.append((region, result))
-                print(f"✅ Completed: {region}")
-            except Exception as exc:
-                print(f"❌ Failed: {region} - {exc}")
-                results.append((region, None))
+        print(f"Dispatching {len(lambda_invocations)} Lambda functions via {len(groups)} {via} of up to {group_size}...")
+        
+        _get_client(service, job_kwargs.get('aws_region', 'us-west-2'))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(groups), max_workers)) as executor:
+            futures = [
+                executor.submit(submit_group, group, date1, date2, satellite, job_kwargs)
+                for group in groups
+            ]
+            
+            for future in concurrent.futures.as_completed(futures):
+                record(future.result(), "Dispatched")
+    elif aioboto3_available():
+        print(f"Invoking {len(lambda_invocations)} Lambda functions concurrently (asyncio, up to {max_workers} in flight)...")
+        record(asyncio.run(_orchestrate_async(lambda_invocations, date1, date2, satellite, job_kwargs, concurrency=max_workers)), "Completed")
+    else:
+        # Split invocations into one batch per worker so the pool never exceeds max_workers threads
+        batch_size = -(-len(lambda_invocations) // max_workers)  # ceil division
+        batches = list(batched(lambda_invocations, batch_size))
+        
+        print(f"Invoking {len(lambda_invocations)} Lambda functions concurrently ({len(batches)} batches of up to {batch_size})...")
+        
+        # Build the shared Lambda client up front so worker threads never queue on _CLIENTS_LOCK for it
+        _get_client('lambda', job_kwargs.get('aws_region', 'us-west-2'))
+        
+        # Asynchronous (Event) invocations return immediately, so wall-clock is bounded by the slowest batch
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(batches), max_workers)) as executor:
+            futures = [
+                executor.submit(_invoke_region_batch, batch, date1, date2, satellite, job_kwargs)
+                for batch in batches
+            ]
+            
+            for future in concurrent.futures.as_completed(futures):
+                record(future.result(), "Completed")
     
     # Summary
-    successful = sum(1 for _, result in results if result is not None)
     print(f"\n{'='*70}")
     print(f"ORCHESTRATION COMPLETE")
     print(f"{'='*70}")
     print(f"Total regions: {len(regions_list)}")
     print(f"Successful invocations: {successful}")
-    print(f"Failed invocations: {len(regions_list) - successful}")
+    print(f"Failed invocations: {len(failed_regions)}")
+    if skipped_regions:
+        print(f"Skipped (sustained submission failures): {len(skipped_regions)}")
     
-    if successful < len(regions_list):
+    if failed_regions or skipped_regions:
         print("\n❌ Some Lambda invocations failed. Check logs above for details.")
+        print(f"💡 Retry with: --regions {','.join(failed_regions + skipped_regions)}")
     else:
         print("\n✅ All Lambda functions invoked successfully!")
         print("💡 Functions are running asynchronously. Monitor CloudWatch logs and S3 for results.")
@@ -496,16 +1093,45 @@ def main():
     print("AWS Satellite Data Processing Job Submission")
     print("=" * 60)
     
-    # Check AWS setup
-    if not check_aws_credentials():
-        print("ERROR: AWS credentials not properly configured")
-        return
+    # Dry runs never call Lambda, so the service probe is skipped; CLI --dry-run overrides config.ini
+    # (read_ini memoises the parse, so load_shared_config below reuses it)
+    config_file = args.config if args.config != '../../config.ini' else script_dir / args.config
+    if args.dry_run:
+        dry_run_requested = args.dry_run.lower() == 'true'
+    else:
+        dry_run_requested = _str_to_bool(read_ini(config_file)[0].get('SETTINGS', {}).get('dry_run', False))
+    
+    # A dry run only prints the events it would send, so it can go ahead without the AWS SDK (and its pre-flight checks)
+    aws_region = args.aws_region
+    if not boto3_available():
+        if args.setup or not dry_run_requested:
+            print("❌ ERROR: boto3 not installed")
+            print("💡 Install: pip install boto3 (or conda env create -f environment.yml)")
+            return
+        print("⚠️  boto3 not installed - skipping AWS pre-flight checks for this dry run")
+        services_future = None
+    else:
+        # Pre-flight results are reused from disk for RESOLVER_CACHE_DURATION unless --update-cache is given
+        precheck_cache = {} if args.update_cache else load_precheck_cache()
+        cache_snapshot = json.dumps(precheck_cache, sort_keys=True)
+        
+        # STS identity and Lambda access probes are independent read-only calls; run them concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            credentials_future = executor.submit(check_aws_credentials, precheck_cache)
+            skip_services = args.setup or dry_run_requested
+            services_future = None if skip_services else executor.submit(check_aws_services, aws_region, precheck_cache)
+        if json.dumps(precheck_cache, sort_keys=True) != cache_snapshot:
+            save_precheck_cache(precheck_cache)
+        
+        # Check AWS setup
+        if not credentials_future.result():
+            print("ERROR: AWS credentials not properly configured")
+            return
     
     # Handle setup mode
     if args.setup:
         aws_cfg = load_aws_config(args.aws_config)
         s3_bucket = args.s3_bucket or aws_cfg['s3_bucket']
-        aws_region = args.aws_region
         setup_success = setup_aws_resources(s3_bucket, aws_region)
         if setup_success:
             print("\n✅ AWS setup completed successfully!")
@@ -514,11 +1140,10 @@ def main():
         return
     
     # Check AWS service access
-    aws_region = args.aws_region
-    service_access = check_aws_services(aws_region)
+    if services_future is not None:
+        services_future.result()
     
     # Load configurations
-    config_file = args.config if args.config != '../../config.ini' else script_dir / args.config
     cfg = load_shared_config(config_file, args)
     aws_cfg = load_aws_config(args.aws_config)
     
@@ -551,6 +1176,11 @@ def main():
     print(f"  Dry run: {dry_run}")
     print()
     
+    # Optional S3 pre-flight; off by default since the Lambda itself reports upload failures
+    if args.deep_check and not test_s3_access(s3_bucket, aws_region, deep_check=True):
+        print("ERROR: S3 bucket not accessible - fix access or drop --deep-check")
+        return
+    
     # Create job name
     jobname = f"aws-{satellite}-{date1.replace('-', '')}"
     
@@ -559,13 +1189,7 @@ def main():
         jobname = f"{jobname}_{start_end_index.replace(':', '_')}"
     
     # Set up logging for AWS jobs
-    log_dir = script_dir / "../logs"
-    mkdir_p(log_dir)
-    logging.basicConfig(
-        filename=f'{log_dir}/aws_job_submission.log', 
-        level=logging.INFO, 
-        format='%(asctime)s:%(levelname)s:%(message)s'
-    )
+    setup_logging(script_dir / "../logs")
     logging.info('--------------------------------------AWS Job Submission----------------------------------------------')
     logging.info(f'AWS Service: {aws_service}, Satellite: {satellite}, Regions: {len(regions_list)} regions ({regions_list[:3]}...{regions_list[-3:] if len(regions_list) > 3 else regions_list})')
     
@@ -589,13 +1213,25 @@ def main():
         'log_name': cfg.get('log_name')
     }
     
+    if not regions_list:
+        # Nothing to submit; also keeps an empty selection away from the worker-pool sizing below
+        print("No regions to process - check --regions/--start_end_index")
+        logging.warning("No regions to process")
+        return
+    
     if aws_service == 'lambda':
+        if args.notify and not dry_run:
+            if aws_cfg.get('sns_topic_arn'):
+                configure_async_notifications(aws_cfg['lambda_function_name'], aws_cfg['sns_topic_arn'], cfg.get('email'), aws_region)
+            else:
+                print("⚠️  --notify requested but no [NOTIFICATIONS] sns_topic_arn in aws_config.ini")
+        
         if len(regions_list) == 1:
             # Single region - use existing logic
             create_aws_lambda_job(jobname, regions_list[0], date1, date2, satellite, **job_kwargs)
         else:
             # Multiple regions - orchestrate multiple Lambda functions
-            orchestrate_lambda_jobs(regions_list, date1, date2, satellite, job_kwargs, aws_cfg, dry_run)
+            orchestrate_lambda_jobs(regions_list, date1, date2, satellite, job_kwargs, aws_cfg, dry_run, fanout=args.fanout, max_workers=args.max_concurrent_invocations)
     else:
         raise ValueError(f"Unsupported AWS service: {aws_service}")
     
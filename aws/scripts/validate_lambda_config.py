@@ -14,6 +14,7 @@ Exit codes:
 """
 
 import sys
+import time
 import argparse
 import boto3
 from typing import Dict, List, Tuple
@@ -22,28 +23,51 @@ from typing import Dict, List, Tuple
 # Update these if requirements change
 REQUIRED_CONFIG = {
     'MemorySize': {
+        'label': 'Memory',
+        'unit': 'MB',
         'min': 10240,  # 10GB minimum for Sentinel-2 processing
         'recommended': 10240,
         'reason': 'Sentinel-2 processing peaks at ~3-4GB memory usage'
     },
     'Timeout': {
+        'label': 'Timeout',
+        'unit': 's',
         'min': 600,  # 10 minutes minimum
         'recommended': 900,  # 15 minutes recommended
         'reason': 'Large date ranges or multiple regions can take 10-15 minutes'
     },
     'EphemeralStorage': {
+        'label': 'Ephemeral Storage',
+        'unit': 'MB',
         'min': 10240,  # 10GB minimum (NOT 512MB default!)
         'recommended': 10240,
-        'reason': 'Sentinel-2 tiles are 60-200MB each, typically 6 tiles = 360-1200MB + processing outputs'
+        'reason': 'Sentinel-2 tiles are 60-200MB each, typically 6 tiles = 360-1200MB + processing outputs',
+        # MOST CRITICAL CHECK: failures get this extra guidance ({function_name}, {min} are filled in)
+        'critical': (
+            "This WILL cause 'No space left on device' errors during Sentinel-2 processing!\n"
+            "   Fix: aws lambda update-function-configuration --function-name {function_name} --ephemeral-storage Size={min}"
+        )
     }
 }
 
+# How to read each REQUIRED_CONFIG value from a get_function_configuration response
+EXTRACTORS = {
+    'MemorySize': lambda config: config.get('MemorySize', 0),
+    'Timeout': lambda config: config.get('Timeout', 0),
+    'EphemeralStorage': lambda config: config.get('EphemeralStorage', {}).get('Size', 512),  # Default is 512MB
+}
+
 REQUIRED_PACKAGE_TYPE = 'Image'  # Must be container-based for GDAL dependencies
 
+CONFIG_CACHE_TTL = 60  # seconds; repeated validations within a run reuse the fetched configuration
+
 
 class ConfigValidator:
     """Validates Lambda configuration against requirements."""
     
+    # function_name -> (fetched_at, configuration), shared by all validators in this process
+    _config_cache: Dict[str, Tuple[float, Dict]] = {}
+    
     def __init__(self, function_name: str):
         self.function_name = function_name
         self.lambda_client = boto3.client('lambda')
@@ -56,17 +80,14 @@ class ConfigValidator:
         
         # Get current configuration
         try:
-            config = self.lambda_client.get_function_configuration(
-                FunctionName=self.function_name
-            )
+            config = self._get_function_configuration()
         except Exception as e:
             self.errors.append(f"Failed to get function configuration: {e}")
             return False
         
         # Run validation checks
-        self._check_memory(config)
-        self._check_timeout(config)
-        self._check_ephemeral_storage(config)
+        for key in REQUIRED_CONFIG:
+            self._check_numeric(config, key)
         self._check_package_type(config)
         self._check_image_uri(config)
         
@@ -75,57 +96,40 @@ class ConfigValidator:
         
         return len(self.errors) == 0
     
-    def _check_memory(self, config: Dict):
-        """Validate memory configuration."""
-        current = config.get('MemorySize', 0)
-        required = REQUIRED_CONFIG['MemorySize']
+    def _get_function_configuration(self) -> Dict:
+        """Fetch the function configuration, reusing a response younger than CONFIG_CACHE_TTL."""
+        cached = self._config_cache.get(self.function_name)
+        if cached and time.monotonic() - cached[0] < CONFIG_CACHE_TTL:
+            return cached[1]
         
-        if current < required['min']:
-            self.errors.append(
-                f"❌ Memory: {current}MB (minimum: {required['min']}MB)\n"
-                f"   Reason: {required['reason']}"
-            )
-        elif current < required['recommended']:
-            self.warnings.append(
-                f"⚠️  Memory: {current}MB (recommended: {required['recommended']}MB)\n"
-                f"   Reason: {required['reason']}"
-            )
-        else:
-            print(f"✅ Memory: {current}MB")
+        config = self.lambda_client.get_function_configuration(
+            FunctionName=self.function_name
+        )
+        self._config_cache[self.function_name] = (time.monotonic(), config)
+        return config
     
-    def _check_timeout(self, config: Dict):
-        """Validate timeout configuration."""
-        current = config.get('Timeout', 0)
-        required = REQUIRED_CONFIG['Timeout']
+    def _check_numeric(self, config: Dict, key: str):
+        """Validate one numeric setting against its REQUIRED_CONFIG minimum and recommendation."""
+        current = EXTRACTORS[key](config)
+        required = REQUIRED_CONFIG[key]
+        label, unit = required['label'], required['unit']
         
         if current < required['min']:
-            self.errors.append(
-                f"❌ Timeout: {current}s (minimum: {required['min']}s)\n"
+            critical = required.get('critical')
+            message = (
+                f"❌ {'CRITICAL: ' if critical else ''}{label}: {current}{unit} (minimum: {required['min']}{unit})\n"
                 f"   Reason: {required['reason']}"
             )
+            if critical:
+                message += "\n   " + critical.format(function_name=self.function_name, min=required['min'])
+            self.errors.append(message)
         elif current < required['recommended']:
             self.warnings.append(
-                f"⚠️  Timeout: {current}s (recommended: {required['recommended']}s)\n"
+                f"⚠️  {label}: {current}{unit} (recommended: {required['recommended']}{unit})\n"
                 f"   Reason: {required['reason']}"
             )
         else:
-            print(f"✅ Timeout: {current}s")
-    
-    def _check_ephemeral_storage(self, config: Dict):
-        """Validate ephemeral storage configuration - MOST CRITICAL CHECK."""
-        storage_config = config.get('EphemeralStorage', {})
-        current = storage_config.get('Size', 512)  # Default is 512MB
-        required = REQUIRED_CONFIG['EphemeralStorage']
-        
-        if current < required['min']:
-            self.errors.append(
-                f"❌ CRITICAL: Ephemeral Storage: {current}MB (minimum: {required['min']}MB)\n"
-                f"   Reason: {required['reason']}\n"
-                f"   This WILL cause 'No space left on device' errors during Sentinel-2 processing!\n"
-                f"   Fix: aws lambda update-function-configuration --function-name {self.function_name} --ephemeral-storage Size={required['min']}"
-            )
-        else:
-            print(f"✅ Ephemeral Storage: {current}MB")
+            print(f"✅ {label}: {current}{unit}")
     
     def _check_package_type(self, config: Dict):
         """Validate package type is Image (container-based)."""
@@ -7,8 +7,18 @@ Translates environment variables → CLI arguments → processing script
 import os
 import subprocess
 import sys
+from collections import deque
 from pathlib import Path
 
+# Lines of script output repeated in the failure summary (full output is streamed live)
+OUTPUT_TAIL_LINES = 50
+
+# Leading bytes of XML/HTML bodies (e.g. S3 error responses) saved in place of a TIFF
+ERROR_BODY_PREFIXES = (b'<?xml', b'<?XML', b'<Error>', b'<html', b'<HTML', b'<!DOCTYPE', b'<!doctype')
+
+# Directories already created by _ensure_dir in this process
+_created_dirs = set()
+
 
 def get_params():
     """Load parameters from environment variables with defaults
@@ -64,6 +74,13 @@ def validate_params(params):
     return True
 
 
+def _ensure_dir(path):
+    """Create path once per process; repeat calls skip the (possibly EFS/NFS) metadata round trip"""
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
+
 def build_command(params, script_path, satellite):
     """Build CLI command for processing script
     
@@ -89,14 +106,14 @@ def build_command(params, script_path, satellite):
     
     # Satellite-specific output directory
     output_dir = f"{processing_base}/{satellite}"
-    os.makedirs(output_dir, exist_ok=True)
+    _ensure_dir(output_dir)
     cmd.extend(["--base_dir", output_dir])
     
     # Logs: Match non-container workflow - create log directory structure
     # Local: logs go to base_dir/slurm_jobs/{satellite}/logs/{log_name}
     # Container: same structure, created by wrapper to match non-container behavior
     log_dir = f"{params['base_dir']}/slurm_jobs/{satellite}/logs"
-    os.makedirs(log_dir, exist_ok=True)
+    _ensure_dir(log_dir)
     log_path = os.path.join(log_dir, params["log_name"])
     cmd.extend(["--log_name", log_path])
     
@@ -123,65 +140,75 @@ def run_processing(params, script_path, satellite):
     print(f"Command: {' '.join(cmd)}")
     print("=" * 60)
     
-    # DEBUG: Check directory structure
-    print(f"\nDEBUG: Pre-flight checks...")
-    print(f"  base_dir: {params['base_dir']}")
-    print(f"  base_dir exists: {os.path.exists(params['base_dir'])}")
-    processing_base = params["base_dir"]
-    if not processing_base.endswith("/1_download_merge_and_clip"):
-        processing_base = f"{processing_base}/1_download_merge_and_clip"
-    output_dir = f"{processing_base}/{satellite}"
-    print(f"  output_dir: {output_dir}")
-    print(f"  output_dir exists: {os.path.exists(output_dir)}")
-    print(f"  output_dir created: OK")
-    print()
-    
     print()
     
     # Change to scripts directory (scripts expect this as CWD)
     os.chdir("/app/1_download_merge_and_clip")
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print("\n✓ Processing completed successfully")
-        if result.stdout:
+        # Stream output as it is produced (visible live in container logs, constant memory);
+        # keep only the last few lines to repeat in the failure summary
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace", bufsize=1)
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        try:
             print("\n=== Script Output ===")
-            print(result.stdout)
-        
-        # Inspect downloaded files for Sentinel-2
-        if satellite == "sentinel2":
-            inspect_sentinel2_files(params)
-        
-        return result.returncode
-    except subprocess.CalledProcessError as e:
-        print(f"\n✗ Processing failed with exit code {e.returncode}")
-        if e.stdout:
-            print("\n=== Script Output ===")
-            print(e.stdout)
-        if e.stderr:
-            print("\n=== Script Error ===")
-            print(e.stderr)
-        
-        # Inspect files even if processing failed
-        if satellite == "sentinel2":
-            inspect_sentinel2_files(params)
-        
-        # Also try to read the log file if it was created
-        log_path = f"{params['base_dir']}/slurm_jobs/{satellite}/logs/{params['log_name']}"
-        if os.path.exists(log_path):
-            print(f"\n=== Log File Contents ({log_path}) ===")
-            with open(log_path, 'r') as f:
-                print(f.read())
-        return e.returncode
+            for line in process.stdout:
+                print(line, end="", flush=True)
+                tail.append(line)
+            returncode = process.wait()
+        finally:
+            # If reading was interrupted (e.g. KeyboardInterrupt), don't leave the script running or unreaped
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
     except Exception as e:
         print(f"\n✗ Unexpected error: {e}")
         return 1
+    
+    report_result(params, satellite, returncode, tail)
+    return returncode
 
 
-def inspect_sentinel2_files(params):
-    """Inspect downloaded Sentinel-2 files to diagnose corruption issues"""
-    import glob
+def report_result(params, satellite, returncode, tail):
+    """Print the outcome of a processing run: status, output tail and log on failure, file inspection"""
+    if returncode == 0:
+        print("\n✓ Processing completed successfully")
+    else:
+        print(f"\n✗ Processing failed with exit code {returncode}")
+        if tail:
+            print(f"\n=== Script Output (last {len(tail)} lines) ===")
+            print("".join(tail), end="")
+    
+    # Inspect downloaded Sentinel-2 files whether or not processing succeeded
+    if satellite == "sentinel2":
+        inspect_sentinel2_files(params)
     
+    # On failure, also show the script's log file if it was created
+    if returncode != 0:
+        log_path = f"{params['base_dir']}/slurm_jobs/{satellite}/logs/{params['log_name']}"
+        try:
+            with open(log_path, 'r') as f:
+                print(f"\n=== Log File Contents ({log_path}) ===")
+                print(f.read())
+        except FileNotFoundError:
+            pass
+
+
+def _iter_tif_files(root, limit):
+    """Yield up to limit .tif paths under root, stopping the directory walk as soon as enough are found"""
+    found = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            if name.endswith(".tif"):
+                yield os.path.join(dirpath, name)
+                found += 1
+                if found >= limit:
+                    return
+
+
+def inspect_sentinel2_files(params, max_files=3):
+    """Inspect downloaded Sentinel-2 files to diagnose corruption issues"""
     print("\n" + "=" * 60)
     print("FILE INSPECTION - Sentinel-2 Downloads")
     print("=" * 60)
@@ -192,18 +219,17 @@ def inspect_sentinel2_files(params):
         print(f"Download directory does not exist: {download_dir}")
         return
     
-    # Find all TIF files
-    tif_files = glob.glob(f"{download_dir}/**/*.tif", recursive=True)
+    # Only the first few TIF files are inspected, so stop walking once they are found
+    tif_files = list(_iter_tif_files(download_dir, max_files))
     
     if not tif_files:
         print("No TIF files found in download directory")
         return
     
-    print(f"Found {len(tif_files)} TIF files")
+    print(f"Inspecting first {len(tif_files)} TIF files")
     print()
     
-    # Inspect first 3 files
-    for tif_file in tif_files[:3]:
+    for tif_file in tif_files:
         print(f"File: {os.path.basename(tif_file)}")
         
         # Check size
@@ -213,12 +239,17 @@ def inspect_sentinel2_files(params):
         
         # Check file type using first few bytes
         with open(tif_file, 'rb') as f:
-            header = f.read(200)
+            magic = f.read(4)
             
             # TIFF files start with II (little-endian) or MM (big-endian)
-            if header[:2] in [b'II', b'MM']:
+            if magic[:2] in [b'II', b'MM']:
                 print(f"  ✅ Valid TIFF magic number detected")
-            elif b'<?xml' in header or b'<Error>' in header or b'<html>' in header.lower():
+                print()
+                continue
+            
+            # Not a TIFF: read the rest of the first 200 bytes to identify an S3 error body
+            header = magic + f.read(196)
+            if header.lstrip().startswith(ERROR_BODY_PREFIXES):
                 print(f"  ❌ CORRUPTED: Contains XML/HTML (likely S3 error response)")
                 print(f"  First 200 bytes:")
                 try:
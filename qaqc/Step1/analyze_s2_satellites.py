@@ -46,6 +46,7 @@ Run on HPC via SLURM wrapper (from qaqc/):
     sbatch run_qaqc_job.sh --step Step1 --script analyze_s2_satellites.py --year 2025
 """
 
+import os
 import re
 import time
 from collections import defaultdict
@@ -57,7 +58,7 @@ import yaml
 
 app = typer.Typer()
 
-IMAGE_EXTS   = {".tif", ".tiff"}
+IMAGE_EXTS   = (".tif", ".tiff")  # lowercase; tested with str.endswith
 GLACIER_RE   = re.compile(r"^\d{3}_")
 SATELLITE_RE = re.compile(r"^(S2[ABC])_", re.IGNORECASE)
 SATELLITES   = ["S2A", "S2B", "S2C"]
@@ -76,15 +77,17 @@ def satellite_of(filename: str) -> str | None:
 def count_by_satellite(directory: Path) -> dict[str, int]:
     """Count image files in a directory, keyed by satellite prefix."""
     counts: dict[str, int] = defaultdict(int)
-    if not directory.exists():
-        return counts
-    for f in directory.iterdir():
-        if f.is_file() and f.suffix.lower() in IMAGE_EXTS:
-            sat = satellite_of(f.name)
-            if sat:
-                counts[sat] += 1
-            else:
-                counts["OTHER"] += 1
+    try:
+        with os.scandir(directory) as it:
+            for e in it:
+                if e.name.lower().endswith(IMAGE_EXTS) and e.is_file():
+                    sat = satellite_of(e.name)
+                    if sat:
+                        counts[sat] += 1
+                    else:
+                        counts["OTHER"] += 1
+    except FileNotFoundError:
+        pass
     return counts
 
 
@@ -130,7 +133,8 @@ def main(
         typer.echo(f"ERROR: directory does not exist: {s2_root}")
         raise typer.Exit(1)
 
-    regions = sorted(d.name for d in s2_root.iterdir() if d.is_dir() and is_glacier_dir(d.name))
+    with os.scandir(s2_root) as it:
+        regions = sorted(e.name for e in it if is_glacier_dir(e.name) and e.is_dir())
     typer.echo(f"Regions       : {len(regions)}")
 
     records = []
@@ -158,15 +162,16 @@ def main(
     elapsed = time.time() - t0
     typer.echo(f"Wrote {len(df)} rows → {csv_path}  ({elapsed:.1f}s)")
 
-    # Summary totals
+    # Summary totals (one column-wise reduction over every count column)
+    totals = df.drop(columns="region").sum()
     typer.echo("\nSummary (all regions):")
     typer.echo(f"  {'Satellite':<8} {'Downloads':>12} {'Clipped':>12}")
     typer.echo(f"  {'-'*34}")
     for sat in SATELLITES:
-        dl = df[f"{sat.lower()}_downloads"].sum()
-        cl = df[f"{sat.lower()}_clipped"].sum()
+        dl = totals[f"{sat.lower()}_downloads"]
+        cl = totals[f"{sat.lower()}_clipped"]
         typer.echo(f"  {sat:<8} {dl:>12,} {cl:>12,}")
-    typer.echo(f"  {'TOTAL':<8} {df['total_downloads'].sum():>12,} {df['total_clipped'].sum():>12,}")
+    typer.echo(f"  {'TOTAL':<8} {totals['total_downloads']:>12,} {totals['total_clipped']:>12,}")
 
 
 if __name__ == "__main__":
@@ -20,6 +20,7 @@ NOTE: Run on HPC (or with the HPC filesystem mounted).  Paths are read from
 qaqc/data_paths.yml — update that file first if paths change.
 """
 
+import os
 import re
 import time
 from pathlib import Path
@@ -30,8 +31,8 @@ import yaml
 
 app = typer.Typer()
 
-# Image file extensions to count
-IMAGE_EXTS = {".tif", ".tiff"}
+# Image file extensions to count (lowercase tuple, tested with str.endswith)
+IMAGE_EXTS = (".tif", ".tiff")
 
 
 # Only include directories that look like glacier regions: 3-digit prefix e.g. 001_, 022_, 192_
@@ -42,11 +43,25 @@ def is_glacier_dir(name: str) -> bool:
     return bool(GLACIER_RE.match(name))
 
 
+def list_glacier_dirs(root: Path) -> list[str]:
+    """Return sorted glacier directory names directly under root (empty if root is missing)."""
+    try:
+        with os.scandir(root) as it:
+            # match the cheap name regex first so non-glacier entries never need a type check
+            return sorted(e.name for e in it if is_glacier_dir(e.name) and e.is_dir())
+    except FileNotFoundError:
+        return []
+
+
 def count_images(directory: Path) -> int:
     """Count image files (tif/tiff) directly inside a directory (non-recursive)."""
-    if not directory.exists():
+    # scandir reuses the directory entry type, so no per-file stat or Path object is needed;
+    # a missing directory surfaces from the listing itself rather than a separate exists() check
+    try:
+        with os.scandir(directory) as it:
+            return sum(1 for e in it if e.name.lower().endswith(IMAGE_EXTS) and e.is_file())
+    except FileNotFoundError:
         return 0
-    return sum(1 for f in directory.iterdir() if f.is_file() and f.suffix.lower() in IMAGE_EXTS)
 
 
 def load_paths(year: str) -> dict:
@@ -104,15 +119,8 @@ def main(
     # ------------------------------------------------------------------ #
     # Collect all region names across both satellites
     # ------------------------------------------------------------------ #
-    s2_regions = sorted(
-        d.name for d in s2_root.iterdir()
-        if d.is_dir() and is_glacier_dir(d.name)
-    ) if s2_root.exists() else []
-
-    ls_regions = sorted(
-        d.name for d in ls_root.iterdir()
-        if d.is_dir() and is_glacier_dir(d.name)
-    ) if ls_root.exists() else []
+    s2_regions = list_glacier_dirs(s2_root)
+    ls_regions = list_glacier_dirs(ls_root)
 
     all_regions = sorted(set(s2_regions) | set(ls_regions))
     typer.echo(f"Total regions : {len(all_regions)}  "
@@ -146,12 +154,14 @@ def main(
     elapsed = time.time() - t0
     typer.echo(f"Wrote {len(df)} rows → {csv_path}  ({elapsed:.1f}s)")
 
-    # quick summary
+    # quick summary (one comparison over the count columns, reduced per column and per row)
+    has_files = df[["sentinel2_downloads", "sentinel2_clipped", "landsat"]] > 0
+    with_files = has_files.sum()
     typer.echo("\nSummary:")
-    typer.echo(f"  Regions with S2 downloads : {(df['sentinel2_downloads'] > 0).sum()}")
-    typer.echo(f"  Regions with S2 clipped   : {(df['sentinel2_clipped'] > 0).sum()}")
-    typer.echo(f"  Regions with Landsat      : {(df['landsat'] > 0).sum()}")
-    typer.echo(f"  Regions with ALL three    : {((df['sentinel2_downloads'] > 0) & (df['sentinel2_clipped'] > 0) & (df['landsat'] > 0)).sum()}")
+    typer.echo(f"  Regions with S2 downloads : {with_files['sentinel2_downloads']}")
+    typer.echo(f"  Regions with S2 clipped   : {with_files['sentinel2_clipped']}")
+    typer.echo(f"  Regions with Landsat      : {with_files['landsat']}")
+    typer.echo(f"  Regions with ALL three    : {has_files.all(axis=1).sum()}")
 
 
 if __name__ == "__main__":
@@ -25,6 +25,7 @@ Usage:
     # raw paths (escape hatch — skips data_paths.yml):
     python compare_netcdf.py --base1 /path/to/new --base2 /path/to/old
 """
+import os
 import typer
 from pathlib import Path
 import xarray as xr
@@ -51,15 +52,16 @@ def _delivery_dir(base: Path) -> Path:
 
 
 def _discover(base: Path) -> list:
-    d = _delivery_dir(base)
-    if not d.exists():
+    try:
+        with os.scandir(_delivery_dir(base)) as it:
+            return sorted(e.name for e in it if e.is_file() and e.name.endswith(".nc"))
+    except FileNotFoundError:
         return []
-    return sorted(f.name for f in d.iterdir() if f.is_file() and f.suffix == ".nc")
 
 
 def _glacier_id(filename: str) -> str:
     """Return the 3-digit_Name prefix, e.g. '014_Courtauld'."""
-    parts = Path(filename).stem.split("_")
+    parts = os.path.splitext(filename)[0].split("_", 2)
     return "_".join(parts[:2])
 
 
@@ -230,12 +232,12 @@ def main(
         b1, b2 = b2, b1
         year1, year2 = year2, year1
 
-    # Sanity check: count delivery files
+    # Sanity check: count delivery files (one listing per directory, reused below)
     d1 = _delivery_dir(b1)
     d2 = _delivery_dir(b2)
-    c1 = len(list(d1.glob("*.nc"))) if d1.exists() else 0
-    c2 = len(list(d2.glob("*.nc"))) if d2.exists() else 0
-    print(f"Delivery counts  base1({year1}): {c1},  base2({year2}): {c2}")
+    files1 = _discover(b1)
+    files2 = _discover(b2)
+    print(f"Delivery counts  base1({year1}): {len(files1)},  base2({year2}): {len(files2)}")
 
     print(f"\nNetCDF Comparison  mode={mode}")
     print(f"  base1 [{year1}]: {b1}")
@@ -243,7 +245,6 @@ def main(
     print("-" * 70)
 
     # Build file list from base1; match to base2 by glacier id
-    files1 = _discover(b1)
     if glacier:
         files1 = [f for f in files1 if f.startswith(glacier)]
         if not files1:
@@ -253,7 +254,6 @@ def main(
     print(f"Found {len(files1)} files in base1\n")
 
     # Build glacier-id → filename index for base2 (handles different year in filename)
-    files2 = _discover(b2)
     idx2 = {_glacier_id(f): f for f in files2}
 
     success, skipped, failed = 0, 0, 0
@@ -39,6 +39,7 @@ Metadata currently recorded per file:
 Additional fields and statistics can be added later as the QAQC workflow
 matures.
 """
+import os
 import re
 import time
 from pathlib import Path
@@ -77,8 +78,7 @@ def file_to_record(path: Path) -> dict:
     rec: dict = {}
 
     # use glacier prefix as identifier
-    rec["glacier"] = path.stem.split("_")[:2]  # e.g. "014_Courtauld"
-    rec["glacier"] = "_".join(rec["glacier"])
+    rec["glacier"] = "_".join(os.path.splitext(path.name)[0].split("_", 2)[:2])  # e.g. "014_Courtauld"
     rec["year"] = extract_year_from_name(path.name)
     rec["index_size"] = ds.sizes.get("index", "")
     rec["y_size"] = ds.sizes.get("y", "")
@@ -93,7 +93,7 @@ def file_to_record(path: Path) -> dict:
     s1 = ds["scene_1_satellite"].values.astype(str)
     s2 = ds["scene_2_satellite"].values.astype(str)
     for sat in ("S2A", "S2B", "S2C", "LC08", "LC09"):
-        rec[f"{sat}_fields"] = sum(a == sat or b == sat for a, b in zip(s1, s2))
+        rec[f"{sat}_fields"] = int(((s1 == sat) | (s2 == sat)).sum())
 
     ds.close()
     return rec
@@ -151,7 +151,17 @@ def main(
     # gather all .nc files from the provided directory list
     all_files: List[Path] = []
     for d in dirs:
-        all_files.extend(sorted(d.glob("*.nc")))
+        # a file given directly (or expanded from a shell glob) is used as-is
+        if d.is_file():
+            if d.suffix == ".nc":
+                all_files.append(d)
+            continue
+        try:
+            with os.scandir(d) as it:
+                names = sorted(e.name for e in it if e.name.endswith(".nc"))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        all_files.extend(d / name for name in names)
     # all_files = all_files[:50]  # TEMP: limit to few files for testing; remove this line to process all files
 
     # if SAMPLE_PREFIXES is populated, restrict to those glaciers only
@@ -25,13 +25,18 @@ Usage:
 
     # Raw path to a delivery directory:
     python validate_netcdf.py --base /path/to/nsidic_v01.1_delivery/
+
+    # Files are validated in parallel by default; force serial execution with:
+    python validate_netcdf.py --year 2025 --no-parallel
 """
 
 import math
+import os
 import typer
 import yaml
 from pathlib import Path
 from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
 
 import xarray as xr
 import numpy as np
@@ -206,11 +211,11 @@ def _check_var_encoding(var_name: str, enc: dict, spec: dict, issues: list) -> N
             issues.append(f"{prefix} _FillValue    : found {enc['_FillValue']!r} (must be absent per NSIDC spec)")
 
 
-def validate_file(path: Path) -> bool:
+def check_file(path: Path) -> tuple[bool, str]:
     """Validate one NetCDF file against the NSIDC absolute spec.
 
-    Returns True if all checks pass, False otherwise.
-    Prints a ✅ / ❌ line with details on failure.
+    Returns (passed, report) where report is the ✅ / ❌ line plus details on failure.
+    Nothing is printed, so results from worker processes can be reported in file order.
     """
     label = path.stem
     issues: list[str] = []
@@ -218,8 +223,7 @@ def validate_file(path: Path) -> bool:
     try:
         ds = xr.open_dataset(path, decode_timedelta=True)
     except Exception as e:
-        print(f"❌ {label:<40} could not open: {e}")
-        return False
+        return False, f"❌ {label:<40} could not open: {e}"
 
     try:
         all_vars = set(ds.data_vars)
@@ -264,13 +268,16 @@ def validate_file(path: Path) -> bool:
         ds.close()
 
     if issues:
-        print(f"❌ {label:<40} FAIL  ({len(issues)} issue(s))")
-        for iss in issues:
-            print(iss)
-        return False
+        return False, "\n".join([f"❌ {label:<40} FAIL  ({len(issues)} issue(s))", *issues])
     else:
-        print(f"✅ {label:<40} PASS")
-        return True
+        return True, f"✅ {label:<40} PASS"
+
+
+def validate_file(path: Path) -> bool:
+    """Validate one NetCDF file and print its report. Returns True if all checks pass."""
+    ok, report = check_file(path)
+    print(report)
+    return ok
 
 
 # ---------------------------------------------------------------------------
@@ -292,16 +299,23 @@ def _delivery_dir(base: Path) -> Path:
     return base / "nsidic_v01.1_delivery"
 
 
-def _discover(base: Path) -> list[Path]:
-    d = _delivery_dir(base)
-    if not d.exists():
+def _list_nc(d: Path) -> list[Path]:
+    """Return the .nc files directly inside d, sorted by name (empty if d is missing)."""
+    try:
+        with os.scandir(d) as it:
+            names = sorted(e.name for e in it if e.is_file() and e.name.endswith(".nc"))
+    except FileNotFoundError:
         return []
-    return sorted(f for f in d.iterdir() if f.is_file() and f.suffix == ".nc")
+    return [d / name for name in names]
+
+
+def _discover(base: Path) -> list[Path]:
+    return _list_nc(_delivery_dir(base))
 
 
 def _glacier_id(filename: str) -> str:
     """Return the 3-digit_Name prefix, e.g. '014_Courtauld'."""
-    parts = Path(filename).stem.split("_")
+    parts = os.path.splitext(filename)[0].split("_", 2)
     return "_".join(parts[:2])
 
 
@@ -315,6 +329,7 @@ def main(
     glacier: Optional[str] = typer.Option(None, help="Glacier prefix to validate (e.g. '014_Courtauld'). Used with --year."),
     file:    Optional[str] = typer.Option(None, help="Absolute path to a single .nc file to validate."),
     base:    Optional[str] = typer.Option(None, help="Absolute path to a delivery directory (raw override; skips data_paths.yml)."),
+    parallel: bool = typer.Option(True, help="Validate files in parallel (set to false for serial test)"),
 ):
     """Validate Step 3 NetCDF delivery files against the NSIDC absolute spec."""
 
@@ -332,7 +347,7 @@ def main(
     elif base:
         # Raw directory override — treat as the delivery directory directly (no subfolder appended)
         b = Path(base)
-        files = sorted(f for f in b.iterdir() if f.is_file() and f.suffix == ".nc") if b.exists() else []
+        files = _list_nc(b)
         if not files:
             typer.echo(f"ERROR: no .nc files found under {base}", err=True)
             raise typer.Exit(1)
@@ -362,9 +377,15 @@ def main(
     print(f"Files to validate: {len(files)}")
     print("-" * 70)
 
+    # each file is opened and decoded independently; map() keeps reports in file order
     passed, failed = 0, 0
-    for f in files:
-        ok = validate_file(f)
+    if parallel and len(files) > 1:
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(check_file, files))
+    else:
+        results = map(check_file, files)
+    for ok, report in results:
+        print(report)
         if ok:
             passed += 1
         else:
@@ -47,8 +47,8 @@
 # CPU usage notes:
 #   Step1 scripts (count_step1_files.py, analyze_s2_satellites.py) — single-core only;
 #     extra CPUs allocated by SBATCH are unused but harmless (jobs finish in seconds).
-#   Step3 extract_metadata.py — parallel by default (ProcessPoolExecutor); uses all
-#     allocated CPUs. Pass --no-parallel to force serial execution.
+#   Step3 extract_metadata.py, validate_netcdf.py — parallel by default (ProcessPoolExecutor);
+#     use all allocated CPUs. Pass --no-parallel to force serial execution.
 #
 # Output: CSVs written to ~/QAQC_Results/{step}/
 #         No TMPDIR staging — scripts run in-place from SLURM_SUBMIT_DIR.
@@ -12,18 +12,28 @@
     - python submit_satellite_job.py --satellite sentinel2 --execution-mode local --date1 2024-10-01 --date2 2024-10-05
     - python submit_satellite_job.py --satellite sentinel2 --memory 64G --runtime 12:00:00 --cores 4
     - python submit_satellite_job.py --config custom_config.ini --satellite sentinel2 --memory 64G --runtime 02:00:00
+    - python submit_satellite_job.py --satellite sentinel2 --start_end_index 0:192 --array --max-concurrent 20
+    - python submit_satellite_job.py --satellite sentinel2 --start_end_index 0:192 --array --batch-size 4 --cores 2
+    - python submit_satellite_job.py --satellite sentinel2 --start_end_index 0:65 --rate-limit 200
 
     Note: For local development, use submit_job.sh wrapper script which handles conda environment activation automatically.
     Direct Python calls require manual environment activation: conda activate glacier_velocity
+    In local mode, --direct runs the processing script with the current (already activated) Python instead of a bash job file.
 
     Author: B. Yadav. Aug 18, 2025
 """
 import os
+import re
+import sys
+import json
 import logging
 import argparse
+import shlex
+import getpass
 import subprocess
 import configparser
 import time
+import tempfile
 from pathlib import Path
 import shutil
 
@@ -44,19 +54,172 @@ parser.add_argument('--dry-run', help='Generate job file but do not submit (true
 parser.add_argument('--email', help='Email for job notifications', type=str)
 parser.add_argument('--execution-mode', help='Execution mode: hpc (SLURM), local (direct), auto (detect)', type=str, choices=['hpc', 'local', 'auto'], default='auto')
 parser.add_argument('--env', help='Conda environment to activate', type=str, default='glacier_velocity')
+parser.add_argument('--direct', help='Local mode only: run the processing script with this Python (env already activated) instead of through a bash job file', action='store_true')
+parser.add_argument('--array', help='Submit a SLURM job array with one task per region instead of one sequential job (HPC only)', action='store_true')
+parser.add_argument('--max-concurrent', help='Maximum array tasks running at once (default: 20)', type=int, default=20)
+parser.add_argument('--rate-limit', help="Maximum sbatch submissions per hour across all your runs of this script, e.g. the site's per-user limit; 0 disables (default: 0)", type=int, default=0)
+parser.add_argument('--batch-size', help='With --array, regions per array task, run side by side as srun steps that each get --memory / batch-size (default: 1)', type=int, default=1)
 
 args = parser.parse_args()
+if args.batch_size < 1:
+    parser.error("--batch-size must be at least 1")
+if args.batch_size > 1 and not args.array:
+    parser.error("--batch-size requires --array")
+if args.rate_limit < 0:
+    parser.error("--rate-limit must be 0 (disabled) or positive")
 
 # Get absolute path to current script directory (global variable). We use this to copy script files to Node's $TMPDIR
 # Alternatively, could use script_dir to run the python script directly from this location (say on Windows, WSL etc.)
 script_dir = Path(__file__).resolve().parent
 print(f"Script directory: {script_dir}")
 
+# Job file templates, filled with str.format and written in one call. Literal braces are doubled.
+# --requeue lets SLURM rerun a preempted job (--open-mode=append keeps the first attempt's output). Outputs go straight
+# to base_dir and reruns skip tiles already downloaded/clipped, so no checkpoint trap is needed.
+# Other directives used in the past: --partition=howat-ice (Unity), --mem-per-cpu, --exclude=u060,u061,u062,u063, --begin=now+0minutes
+SLURM_TEMPLATE = """#!/usr/bin/env bash
+
+#SBATCH --job-name={jobname}
+{output_directives}
+#SBATCH --time={runtime}
+{task_directives}
+#SBATCH --mem={memory}
+#SBATCH --mail-type=ALL
+#SBATCH --mail-user={email}
+#SBATCH --partition=howat,batch
+#SBATCH --requeue
+#SBATCH --open-mode=append
+
+# Activate appropriate conda environment.
+eval "$(conda shell.bash hook)"
+conda activate {env}
+date; hostname; pwd
+python --version; which python
+# Importing the geo stack just to print versions costs seconds per task; only the first array task pays it
+if [[ "${{SLURM_ARRAY_TASK_ID:-0}}" == "${{SLURM_ARRAY_TASK_MIN:-0}}" ]]; then
+    python -c "for p in ['rioxarray','rasterio','osgeo','geopandas','xarray']: print(f'\\t{{p}}: {{__import__(p).__version__}}')"
+else
+    echo "Package versions: see log of array task $SLURM_ARRAY_TASK_MIN"
+fi
+echo $SLURM_SUBMIT_DIR
+echo ========================================================
+
+cd $TMPDIR
+{payload}"""
+
+# Local runs skip the scheduler header and $TMPDIR staging
+BASH_TEMPLATE = """#!/usr/bin/env bash
+
+# Activate appropriate conda environment.
+eval "$(conda shell.bash hook)"
+conda activate {env}
+date; hostname; pwd
+python --version; which python
+python -c "for p in ['rioxarray','rasterio','geopandas','xarray']: print(f'\\t{{p}}: {{__import__(p).__version__}}')"
+echo ========================================================
+
+{payload}"""
+
+# Shared by both job types: stage the code, run it, report where outputs went.
+# cd into 1_download_merge_and_clip is required because the ancillary folder is located there
+PAYLOAD_TEMPLATE = """cp -r {script_dir}/1_download_merge_and_clip .
+cd 1_download_merge_and_clip
+{run_block}
+echo Check outputs at base_dir = {base_dir}
+echo Finished Slurm job 
+"""
+
+# Processing script and arguments per satellite (run from inside 1_download_merge_and_clip)
+SATELLITE_COMMANDS = {
+    "sentinel2": "python sentinel2/download_merge_clip_sentinel2.py {region_param} --date1 {date1} --date2 {date2} --download_flag {download_flag} --post_processing_flag {post_processing_flag} --clear_downloads {clear_downloads} --base_dir {base_dir} --log_name {log_name}",
+    "landsat": "python landsat/download_clip_landsat.py {region_param} --date1 {date1} --date2 {date2} --base_dir {base_dir} --log_name {log_name}",
+}
+
+
+# sbatch retries: only transient controller errors are retried, with exponential backoff (1, 2, 4, 8 s)
+SBATCH_MAX_ATTEMPTS = 5
+SBATCH_RETRY_MARKERS = ("Socket timed out", "temporarily unable", "Resource temporarily unavailable")
+
+# Submission token bucket, shared by every run of this script for the user (e.g. a driver loop over index ranges)
+# Same cache folder as aws/scripts/submit_aws_job.py (PRECHECK_CACHE_FILE)
+SUBMIT_BUCKET_FILE = Path.home() / ".cache" / "greenland-glacier" / "submit_bucket.json"
+
+
+def take_submit_token(jobs_per_hour):
+    """Block until the shared token bucket allows another sbatch call, then consume one token
+        Keeps rapid batch submissions under the scheduler's per-user submission limits. The bucket holds one
+        hour's budget, so a sweep within the limit goes at full speed and only longer runs are paced
+    """
+    import fcntl  # POSIX only; imported here so local runs on Windows don't need it
+    rate = jobs_per_hour / 3600  # tokens per second
+    SUBMIT_BUCKET_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(SUBMIT_BUCKET_FILE, "a+") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)  # held while waiting, so concurrent submitters queue up in turn
+        fh.seek(0)
+        now = time.time()
+        try:
+            state = json.load(fh)
+            tokens = min(jobs_per_hour, float(state["tokens"]) + (now - float(state["ts"])) * rate)
+        except (ValueError, KeyError, TypeError):  # new, truncated or hand-edited file: start with a full bucket
+            tokens = jobs_per_hour
+        if tokens < 1:
+            wait = (1 - tokens) / rate
+            print(f"Submission rate limit ({jobs_per_hour}/hour) reached; waiting {wait:.0f}s")
+            logging.info(f"Submission rate limit ({jobs_per_hour}/hour) reached; waiting {wait:.0f}s")
+            time.sleep(wait)
+            now, tokens = now + wait, 1
+        fh.seek(0)
+        fh.truncate()
+        json.dump({"tokens": tokens - 1, "ts": now}, fh)
+
+
+def submit_slurm_job(job_file, rate_limit=0):
+    """Submit a job file with sbatch, retrying only while the SLURM controller is busy
+        sbatch runs from the job file's folder, so that becomes $SLURM_SUBMIT_DIR and holds the OUT/ folder
+        rate_limit > 0 caps submissions per hour through the shared token bucket (see take_submit_token)
+    """
+    job_file = Path(job_file)
+    if rate_limit:
+        take_submit_token(rate_limit)
+    for attempt in range(SBATCH_MAX_ATTEMPTS):
+        result = subprocess.run(['sbatch', job_file.name], capture_output=True, text=True, cwd=job_file.parent)
+        if result.returncode == 0:
+            print(result.stdout.strip())  # "Submitted batch job <id>"
+            logging.info(result.stdout.strip())
+            return
+        error = result.stderr.strip()
+        if attempt == SBATCH_MAX_ATTEMPTS - 1 or not any(marker in error for marker in SBATCH_RETRY_MARKERS):
+            print(error)
+            result.check_returncode()
+        delay = 2 ** attempt
+        print(f"sbatch failed ({error}); retrying in {delay}s")
+        logging.warning(f"sbatch failed ({error}); retry {attempt + 1} in {delay}s")
+        time.sleep(delay)
+
+
+def build_command(satellite, date1, date2, download_flag, post_processing_flag, clear_downloads, base_dir):
+    """Return the processing command line for the given satellite
+        {region_param} and {log_name} are left in place for the job writer, which knows the region selection
+    """
+    template = SATELLITE_COMMANDS.get(satellite.lower())
+    if template is None:
+        raise ValueError(f"Unsupported satellite type: {satellite}. Supported types are 'sentinel2' and 'landsat'.")
+    return template.format(region_param="{region_param}", date1=date1, date2=date2, download_flag=download_flag,
+                           post_processing_flag=post_processing_flag, clear_downloads=clear_downloads, base_dir=base_dir, log_name="{log_name}")
+
+
+def split_memory(memory, parts):
+    """Divide a SLURM memory size (e.g. 48G, 16gb, 4000 = MB) into equal per-step shares, returned in MB"""
+    match = re.fullmatch(r"(\d+)\s*([KMGT]?)B?", str(memory).strip(), re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Cannot parse memory size: {memory}")
+    scale = {"K": 1 / 1024, "": 1, "M": 1, "G": 1024, "T": 1024 ** 2}[match.group(2).upper()]
+    return f"{max(1, int(int(match.group(1)) * scale // parts))}M"
+
 
 def mkdir_p(folder):
     '''make a (sub) directory (folder) if it doesn't exist'''
-    if not os.path.exists(folder):
-        os.makedirs(folder, exist_ok=True)
+    Path(folder).mkdir(parents=True, exist_ok=True)
 
 
 def detect_execution_mode():
@@ -73,44 +236,36 @@ def detect_execution_mode():
     return 'local'
 
 
-def create_bash_job(jobname, regions, start_end_index, date1, date2, base_dir, download_flag, post_processing_flag, clear_downloads, cores, memory, runtime, dry_run, email, log_name, satellite, env):
+def create_bash_job(jobname, regions, start_end_index, date1, date2, base_dir, cmd, cores, memory, runtime, dry_run, email, log_name, satellite, env, output_dir, direct=False):
     """ Generate and call bash script for either Sentinel-2 or Landsat
         This part is mostly for prototyping and testing on local machine
+        cmd is the processing command from build_command; the job file is written to and run from output_dir
+        With direct=True the processing script is run with this interpreter instead (no job file, bash or conda activation),
+        from the same staged copy of 1_download_merge_and_clip in output_dir that the job file would use
     """
     logging.info(f'jobname = {jobname}    base_dir = {base_dir}   date1 = {date1}   date2 = {date2}   regions = {regions}   start_end_index = {start_end_index}   satellite = {satellite}\n') 
-    job_file = os.path.join(os.getcwd(), f"{jobname}.job")
+    # Determine region selection method (mutually exclusive: either specific regions OR batch index range)
+    region_param = f"--start_end_index {start_end_index}" if start_end_index else f"--regions {regions}"
+    cmd = cmd.format(region_param=region_param, log_name=log_name)
+
+    if direct and not dry_run:
+        if os.environ.get('CONDA_DEFAULT_ENV') != env:
+            print(f"Warning: --direct runs with {sys.executable}, but conda env '{env}' is not the active one")
+        # Mirror PAYLOAD_TEMPLATE: stage the code in output_dir and run from there (ancillary folder is in 1_download_merge_and_clip)
+        work_dir = Path(output_dir) / "1_download_merge_and_clip"
+        shutil.copytree(script_dir / "1_download_merge_and_clip", work_dir, dirs_exist_ok=True)
+        argv = [sys.executable] + shlex.split(cmd)[1:]
+        print(f"Running directly: {cmd}")
+        logging.info(f"Running directly with {sys.executable}")
+        subprocess.run(argv, check=True, cwd=work_dir)
+        print(f"Check outputs at base_dir = {base_dir}")
+        return
+
+    job_file = Path(output_dir) / f"{jobname}.job"
     print(f"Jobfile: {job_file}")
-    with open(job_file, 'w') as fh:
-        fh.writelines("#!/usr/bin/env bash\n\n")
-        fh.writelines("# Activate appropriate conda environment.\n")
-        fh.writelines("eval \"$(conda shell.bash hook)\"\n")
-        fh.writelines(f"conda activate {env}\n")
-        fh.writelines("date; hostname; pwd\n")         # Add host, time, and directory name for later troubleshooting
-        fh.writelines("python --version; which python\n")  # Check python version
-        fh.writelines("python -c \"for p in ['rioxarray','rasterio','geopandas','xarray']: print(f'\\t{p}: {__import__(p).__version__}')\"\n")  # Check key package versions
-        fh.writelines("echo ========================================================\n")
-        fh.writelines("\n")
-        # fh.writelines("cd $TMPDIR\n")
-        # upto this point, it can be common to other jobs as well
-        # fh.writelines(f"mkdir -p $out_folder\n")  # creating directly here using python code.  
-
-        fh.writelines(f"cp -r {script_dir}/1_download_merge_and_clip .\n")
-        fh.writelines("cd 1_download_merge_and_clip\n")  # required because ancillary folder located here
-        
-        # Determine region selection method (mutually exclusive: either specific regions OR batch index range)
-        region_param = f"--start_end_index {start_end_index}" if start_end_index else f"--regions {regions}"
-        
-        # Choose the appropriate script and parameters based on satellite type
-        if satellite.lower() == "sentinel2":
-            fh.writelines(f"python sentinel2/download_merge_clip_sentinel2.py {region_param} --date1 {date1} --date2 {date2} --download_flag {download_flag} --post_processing_flag {post_processing_flag} --clear_downloads {clear_downloads} --base_dir {base_dir} --log_name {log_name}\n")
-        elif satellite.lower() == "landsat":
-            fh.writelines(f"python landsat/download_clip_landsat.py {region_param} --date1 {date1} --date2 {date2} --base_dir {base_dir} --log_name {log_name}\n")
-        else:
-            raise ValueError(f"Unsupported satellite type: {satellite}. Supported types are 'sentinel2' and 'landsat'.")
-            
-        # fh.writelines("tree -L 2 \n")  # $out_folder
-        fh.writelines(f"echo Check outputs at base_dir = {base_dir}\n")
-        fh.writelines("echo Finished Slurm job \n")
+
+    payload = PAYLOAD_TEMPLATE.format(script_dir=script_dir, run_block=cmd, base_dir=base_dir)
+    job_file.write_text(BASH_TEMPLATE.format(env=env, payload=payload))
     
     # Submit the job (unless dry_run is enabled)
     if dry_run:
@@ -118,64 +273,78 @@ def create_bash_job(jobname, regions, start_end_index, date1, date2, base_dir, d
         logging.info(f"DRY RUN: Job file created but not submitted")
     else:
         print(f"Submitting job: {job_file}")
-        subprocess.run(['bash', job_file], check=True)  # TODO: check best practice
+        subprocess.run(['bash', job_file.name], check=True, cwd=output_dir)  # TODO: check best practice
 
 
-def create_slurm_job(jobname, regions, start_end_index, date1, date2, base_dir, download_flag, post_processing_flag, clear_downloads, cores, memory, runtime, dry_run, email, log_name, satellite, env):
-    """ Generate SLURM job file and submit it for either Sentinel-2 or Landsat """
+def create_slurm_job(jobname, regions, start_end_index, date1, date2, base_dir, cmd, cores, memory, runtime, dry_run, email, log_name, satellite, env, output_dir, array=False, max_concurrent=20, batch_size=1, rate_limit=0):
+    """ Generate SLURM job file and submit it for either Sentinel-2 or Landsat
+        cmd is the processing command from build_command; the job file is written to and submitted from output_dir
+        With array=True, a single submission holds one array task per region (at most max_concurrent running at once);
+        batch_size > 1 packs that many regions into each task, run as parallel srun steps within its allocation
+    """
     logging.info(f'jobname = {jobname}    base_dir = {base_dir}   date1 = {date1}   date2 = {date2}   regions = {regions}   start_end_index = {start_end_index}   satellite = {satellite}\n') 
-    job_file = os.path.join(os.getcwd(), f"{jobname}.job")
+    job_file = Path(output_dir) / f"{jobname}.job"
     print(f"Jobfile: {job_file}")
 
-    # lizard_data = os.path.join(data_dir, lizard)
-    # Create lizard directories
-    # mkdir_p(lizard_data)
-    with open(job_file, 'w') as fh:
-        fh.writelines("#!/usr/bin/env bash\n\n")
-        # fh.writelines(f"#SBATCH --partition=howat-ice\n")  # for Unity  eg: howat-ice
-        fh.writelines(f"#SBATCH --job-name={jobname}\n")
-        fh.writelines("#SBATCH --output=OUT/%x_%j.out\n")  # On Unity, OUT directory will be created if it doesn't exist 
-        fh.writelines(f"#SBATCH --time={runtime}\n")
-        fh.writelines(f"#SBATCH --nodes=1 --ntasks={cores}\n")        
-        # fh.writelines(f"#SBATCH --mem-per-cpu={memory}\n")
-        fh.writelines(f"#SBATCH --mem={memory}\n")
-        fh.writelines("#SBATCH --mail-type=ALL\n")
-        fh.writelines(f"#SBATCH --mail-user={email}\n")
-        fh.writelines("#SBATCH --partition=howat,batch\n")
-        # fh.writelines("#SBATCH --exclude=u060,u061,u062,u063\n")
-        # fh.writelines("#SBATCH --begin=now+0minutes\n")
-        fh.writelines("\n")
-        fh.writelines("# Activate appropriate conda environment.\n")
-        fh.writelines("eval \"$(conda shell.bash hook)\"\n")
-        fh.writelines(f"conda activate {env}\n")
-        fh.writelines("date; hostname; pwd\n")         # Add host, time, and directory name for later troubleshooting
-        fh.writelines("python --version; which python\n")  # Check python version
-        fh.writelines("python -c \"for p in ['rioxarray','rasterio','osgeo','geopandas','xarray']: print(f'\\t{p}: {__import__(p).__version__}')\"\n")  # Check key package versions
-        # # first thing we do when the job starts is to "change directory to the place where the job was submitted from".
-        fh.writelines("echo $SLURM_SUBMIT_DIR\n")
-        fh.writelines("echo ========================================================\n")
-        fh.writelines("\n")
-        fh.writelines("cd $TMPDIR\n")
-        # upto this point, it can be common to other jobs as well
-        # fh.writelines(f"mkdir -p $out_folder\n")  # creating directly here using python code.  
-
-        fh.writelines(f"cp -r {script_dir}/1_download_merge_and_clip .\n")
-        fh.writelines("cd 1_download_merge_and_clip\n")
-        
-        # Determine region selection method (mutually exclusive: either specific regions OR batch index range)
-        region_param = f"--start_end_index {start_end_index}" if start_end_index else f"--regions {regions}"
-        
-        # Choose the appropriate script and parameters based on satellite type
-        if satellite.lower() == "sentinel2":
-            fh.writelines(f"python sentinel2/download_merge_clip_sentinel2.py {region_param} --date1 {date1} --date2 {date2} --download_flag {download_flag} --post_processing_flag {post_processing_flag} --clear_downloads {clear_downloads} --base_dir {base_dir} --log_name {log_name}\n")
-        elif satellite.lower() == "landsat":
-            fh.writelines(f"python landsat/download_clip_landsat.py {region_param} --date1 {date1} --date2 {date2} --base_dir {base_dir} --log_name {log_name}\n")
+    # Determine region selection method (mutually exclusive: either specific regions OR batch index range)
+    region_param = f"--start_end_index {start_end_index}" if start_end_index else f"--regions {regions}"
+    array_lines = []    # bash run ahead of the processing command in array mode
+    loop_header = None  # with batch_size > 1, the command runs once per region inside this loop
+    if array:
+        if start_end_index:
+            start, _, end = start_end_index.partition(':')
+            if not end:
+                raise ValueError(f"--array needs an explicit end index (e.g. 0:65), got start_end_index={start_end_index}")
+            start, end = int(start or 0), int(end)
+            if batch_size == 1:
+                # Each task processes the one-region slice at its own index
+                first, last = start, end - 1
+                region_param = "--start_end_index $SLURM_ARRAY_TASK_ID:$((SLURM_ARRAY_TASK_ID+1))"
+                region_tag = "${SLURM_ARRAY_TASK_ID}"
+            else:
+                # Task k processes indices [start + k*batch_size, start + (k+1)*batch_size) clipped to end
+                first, last = 0, -(-(end - start) // batch_size) - 1
+                array_lines += [f"FIRST=$(({start} + SLURM_ARRAY_TASK_ID * {batch_size}))",
+                                f"LAST=$((FIRST + {batch_size} < {end} ? FIRST + {batch_size} : {end}))"]
+                loop_header = "for ((i = FIRST; i < LAST; i++)); do"
+                region_param = "--start_end_index $i:$((i+1))"
+                region_tag = "${i}"
         else:
-            raise ValueError(f"Unsupported satellite type: {satellite}. Supported types are 'sentinel2' and 'landsat'.")
-            
-        # fh.writelines("tree -L 2 $TMPDIR\n")  # $out_folder
-        fh.writelines(f"echo Check outputs at base_dir = {base_dir}\n")
-        fh.writelines("echo Finished Slurm job \n")
+            # Each task picks its region(s) from a bash array written into the job file
+            region_list = regions.split(',')
+            array_lines.append(f"REGIONS=({' '.join(region_list)})")
+            first, last = 0, -(-len(region_list) // batch_size) - 1
+            if batch_size == 1:
+                region_param = "--regions ${REGIONS[$SLURM_ARRAY_TASK_ID]}"
+                region_tag = "${SLURM_ARRAY_TASK_ID}"
+            else:
+                loop_header = f'for REGION in "${{REGIONS[@]:$((SLURM_ARRAY_TASK_ID * {batch_size})):{batch_size}}}"; do'
+                region_param = "--regions $REGION"
+                region_tag = "${REGION}"
+        # Separate log per region so concurrent runs don't interleave in one file
+        log_root, log_ext = os.path.splitext(log_name)
+        log_name = f"{log_root}_{region_tag}{log_ext}"
+
+    cmd = cmd.format(region_param=region_param, log_name=log_name)
+
+    if array:
+        output_directives = f"#SBATCH --array={first}-{last}%{max_concurrent}\n#SBATCH --output=OUT/%x_%A_%a.out"  # one output per array task
+    else:
+        output_directives = "#SBATCH --output=OUT/%x_%j.out"  # On Unity, OUT directory will be created if it doesn't exist
+    if loop_header:
+        # Regions in this task share the allocation (one srun step each); each keeps its own stdout so one failure stays isolated.
+        # Each step gets an equal slice of --memory: a step without --mem claims the whole job memory and the rest would queue behind it
+        task_directives = f"#SBATCH --nodes=1 --ntasks={batch_size} --cpus-per-task={cores}"
+        step_memory = split_memory(memory, batch_size)
+        run_lines = [loop_header, f"    srun --exclusive -N1 -n1 -c {cores} --mem={step_memory} {cmd} > {log_root}_{region_tag}.out 2>&1 &", "done", "wait"]
+    else:
+        task_directives = f"#SBATCH --nodes=1 --ntasks={cores}"
+        run_lines = [cmd]
+
+    payload = PAYLOAD_TEMPLATE.format(script_dir=script_dir, run_block="\n".join(array_lines + run_lines), base_dir=base_dir)
+    job_file.write_text(SLURM_TEMPLATE.format(
+        jobname=jobname, output_directives=output_directives, runtime=runtime, task_directives=task_directives,
+        memory=memory, email=email, env=env, payload=payload))
     
     # Submit the job (unless dry_run is enabled)
     if dry_run:
@@ -183,7 +352,11 @@ def create_slurm_job(jobname, regions, start_end_index, date1, date2, base_dir,
         logging.info(f"DRY RUN: Job file created but not submitted")
     else:
         print(f"Submitting job: {job_file}")
-        subprocess.run(['sbatch', job_file], check=True)  # This is more robust and recommended
+        submit_slurm_job(job_file, rate_limit=rate_limit)
+
+
+# Config keys that a CLI argument of the same (argparse) name replaces; dry_run is handled separately (string to bool)
+CLI_OVERRIDES = ('satellite', 'regions', 'start_end_index', 'date1', 'date2', 'base_dir', 'cores', 'memory', 'runtime', 'email', 'execution_mode', 'env')
 
 
 def load_config(config_file="config.ini", cli_args=None):
@@ -231,34 +404,14 @@ def load_config(config_file="config.ini", cli_args=None):
         'env': config.get("SETTINGS", "env", fallback="glacier_velocity")
     }
     
-    # Override with command line arguments if provided
+    # Override with command line arguments if provided (an explicit 0, e.g. --cores 0, still overrides)
     if cli_args:
-        if cli_args.satellite:
-            config_dict['satellite'] = cli_args.satellite
-        if cli_args.regions:
-            config_dict['regions'] = cli_args.regions
-        if cli_args.start_end_index:
-            config_dict['start_end_index'] = cli_args.start_end_index
-        if cli_args.date1:
-            config_dict['date1'] = cli_args.date1
-        if cli_args.date2:
-            config_dict['date2'] = cli_args.date2
-        if cli_args.base_dir:
-            config_dict['base_dir'] = cli_args.base_dir
-        if cli_args.cores:
-            config_dict['cores'] = cli_args.cores
-        if cli_args.memory:
-            config_dict['memory'] = cli_args.memory
-        if cli_args.runtime:
-            config_dict['runtime'] = cli_args.runtime
-        if cli_args.email:
-            config_dict['email'] = cli_args.email
+        for key in CLI_OVERRIDES:
+            value = getattr(cli_args, key, None)
+            if value is not None:
+                config_dict[key] = value
         if cli_args.dry_run is not None:
             config_dict['dry_run'] = cli_args.dry_run.lower() == 'true'
-        if cli_args.execution_mode:
-            config_dict['execution_mode'] = cli_args.execution_mode
-        if cli_args.env:
-            config_dict['env'] = cli_args.env
     
     return config_dict
 
@@ -297,11 +450,13 @@ def main():
     execution_mode = cfg['execution_mode']
     env = cfg['env']
     
-    # Auto-append batch range to log name if using start_end_index
-    if start_end_index:
-        base_log = log_name.rsplit('.', 1)[0]
-        ext = log_name.rsplit('.', 1)[1] if '.' in log_name else 'log'
-        log_name = f"{base_log}_{start_end_index.replace(':', '_')}.{ext}"
+    # Auto-append batch range to log name and job name if using start_end_index (e.g. 0:25 -> _0_25)
+    batch_suffix = f"_{start_end_index.replace(':', '_')}" if start_end_index else ""
+    if batch_suffix:
+        base_log, dot, ext = log_name.rpartition('.')
+        if not dot:
+            base_log, ext = log_name, 'log'
+        log_name = f"{base_log}{batch_suffix}.{ext}"
 
     # Determine execution mode (ie running on HPC or local machine)
     if execution_mode == 'auto':
@@ -313,22 +468,25 @@ def main():
     if env != "glacier_velocity":
         root_dir = f"{root_dir}_{env}"  # Append env name for testing different python environments (rasterio 1.5.0 compatibility fixes etc.)
     base_dir = f"{root_dir}/1_download_merge_and_clip/{satellite}"  # This is where files will be downloaded, merged, clipped, and saved
-    mkdir_p(f"{base_dir}")  # Create base directory if it doesn't exist
+    # Validate the satellite and build its command once, before anything is written to disk
+    cmd = build_command(satellite, date1, date2, download_flag, post_processing_flag, clear_downloads, base_dir)
 
     # mkdir_p(f"{root_dir}")  # Create parent base directory if it doesn't exist to hold all outputs
-    slurm_dir = f"{root_dir}/slurm_jobs/{satellite}"  # Path(root_dir) / "slurm_jobs"
-    mkdir_p(slurm_dir)  # Create slurm_jobs directory if it doesn't exist to hold all slurm related job, outputs, logs
+    slurm_dir = f"{root_dir}/slurm_jobs/{satellite}"  # holds all slurm related job, outputs, logs
     log_dir = Path(slurm_dir) / "logs"
-    mkdir_p(log_dir)  # Create log directory if it doesn't exist
-    os.chdir(slurm_dir)  # Change to slurm_jobs directory to hold all slurm related job, outputs, logs
+    if dry_run:
+        # Leave the (possibly shared, slow) production tree untouched; the job file itself is identical to a real run
+        # Stable per-user folder, so repeated dry runs overwrite their previous job file instead of piling up
+        job_dir = Path(tempfile.gettempdir()) / f"gg_dryrun_{getpass.getuser()}" / satellite
+        mkdir_p(job_dir)
+    else:
+        mkdir_p(base_dir)  # Create base directory if it doesn't exist
+        mkdir_p(log_dir)  # Creates slurm_dir along with the log directory
+        job_dir = slurm_dir
     # Path(log_name).touch()
 
     # Create job name using date strings from config
-    jobname = f"{satellite.lower()}_{date1.replace('-', '')}"  # _{date2.replace('-', '')}
-    
-    # Auto-append batch range to job name if using start_end_index
-    if start_end_index:
-        jobname = f"{jobname}_{start_end_index.replace(':', '_')}"
+    jobname = f"{satellite.lower()}_{date1.replace('-', '')}{batch_suffix}"  # _{date2.replace('-', '')}
     
     if len(jobname) > 50:
         jobname = jobname[:50]  # Truncate to first 50 characters to avoid overly long job names
@@ -337,17 +495,22 @@ def main():
     # Set up logging using current YMDHM format.
     # logfile_prefix = datetime.now().strftime("%Y%m%d")  # ("%Y%m%d_%H")
     # logging.basicConfig(filename=f'slurm_job_submission_{logfile_prefix}.log', level=logging.INFO, format='%(asctime)s:%(levelname)s:%(message)s')
-    logging.basicConfig(filename=f'slurm_job_submission.log', level=logging.INFO, format='%(asctime)s:%(levelname)s:%(message)s')
+    logging.basicConfig(filename=f'{job_dir}/slurm_job_submission.log', level=logging.INFO, format='%(asctime)s:%(levelname)s:%(message)s')
     logging.info('--------------------------------------Job Creation/Submission info----------------------------------------------')
     if execution_mode == 'hpc':
         logging.info("Execution mode: HPC (SLURM detected)")
+        if args.direct:
+            print("Note: --direct only applies to local execution; submitting to SLURM")
         create_slurm_job(jobname=jobname, regions=regions, start_end_index=start_end_index, date1=date1, date2=date2,
-                         base_dir=base_dir, download_flag=download_flag, post_processing_flag=post_processing_flag, clear_downloads=clear_downloads,
-                         cores=cores, memory=memory, runtime=runtime, dry_run=dry_run, email=email, log_name=f"{log_dir}/{log_name}", satellite=satellite, env=env)
+                         base_dir=base_dir, cmd=cmd,
+                         cores=cores, memory=memory, runtime=runtime, dry_run=dry_run, email=email, log_name=f"{log_dir}/{log_name}", satellite=satellite, env=env, output_dir=job_dir,
+                         array=args.array, max_concurrent=args.max_concurrent, batch_size=args.batch_size, rate_limit=args.rate_limit)
     elif execution_mode == 'local':
+        if args.array:
+            print("Note: --array only applies to SLURM submission; processing regions sequentially")
         create_bash_job(jobname=jobname, regions=regions, start_end_index=start_end_index, date1=date1, date2=date2,
-                        base_dir=base_dir, download_flag=download_flag, post_processing_flag=post_processing_flag, clear_downloads=clear_downloads,
-                        cores=cores, memory=memory, runtime=runtime, dry_run=dry_run, email=email, log_name=f"{log_dir}/{log_name}", satellite=satellite, env=env)
+                        base_dir=base_dir, cmd=cmd,
+                        cores=cores, memory=memory, runtime=runtime, dry_run=dry_run, email=email, log_name=f"{log_dir}/{log_name}", satellite=satellite, env=env, output_dir=job_dir, direct=args.direct)
         logging.info("Execution mode: Local (direct execution)")
     else:
         raise ValueError(f"Unsupported execution mode: {execution_mode}. Supported modes are 'auto', 'hpc', and 'local'.")
@@ -356,7 +519,6 @@ def main():
     # python download_clip_landsat.py --regions $regions --date1 $date1 --date2 $date2 --base_dir $base_dir --log_name $log_name
 
     
-    time.sleep(1)  # sleep for a second to avoid job submission too fast
     logging.info("Job submission complete\n")
 
 